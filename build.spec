@@ -43,6 +43,7 @@ a = Analysis(
     hiddenimports=[
         'PyQt5.sip',
         'bs4',
+        'lxml',
         'requests'
     ],
     hookspath=[],
@@ -1,19 +1,30 @@
+import errno
 import os
+import random
 import re
 import sys
+import threading
 import time
 import webbrowser
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+import copy
 import json # For persistent theme settings
+import mmap
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import Qt, QUrl, QThread, pyqtSignal, QMutex, QMutexLocker, QPropertyAnimation, QEasingCurve, QRect, QSize
+from PyQt5.QtCore import Qt, QUrl, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QSize
 from PyQt5.QtGui import QFont, QFontDatabase, QDesktopServices, QColor, QPalette, QPixmap, QPainter, QLinearGradient # Import QFontDatabase
-from qt_material import apply_stylesheet
+from qt_material import build_stylesheet
 
 try:
     import qtawesome as qta
@@ -21,17 +32,55 @@ except ImportError:
     qta = None
     print("qt_awesome not installed. Icons will not be displayed.")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None # Standard json is used for config.json instead
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 
 # Global configuration
 INPUT_FILE = "input.txt"
 DOWNLOADS_FOLDER = "downloads"
-MAX_WORKERS = 6  # Maximum concurrent download chunks
+MAX_WORKERS = 6  # Starting number of concurrent download chunks for an unknown host
+MIN_CHUNK_WORKERS = 2  # Bounds for the adaptive chunk concurrency
+MAX_CHUNK_WORKERS = 32
+TUNE_WINDOW = 5.0  # Seconds of throughput measured before each concurrency adjustment
+RESOLVE_AHEAD = 2  # Links whose pages are fetched in the background while the current file downloads
 CONFIG_FILE = "config.json" # For persistent settings
 
-if not os.path.exists(DOWNLOADS_FOLDER):
-    os.makedirs(DOWNLOADS_FOLDER)
-
-HEADERS = {
+# Direct URL inside the redirector page's download() script, matched without leaving that <script>.
+# Bytes pattern: it runs on the raw response body so the page never has to be decoded.
+DOWNLOAD_SCRIPT_RE = re.compile(
+    rb'function download(?:(?!</script>).)*?window\.open\(["\'](https?://[^\s"\'\)]+)',
+    re.DOTALL,
+)
+# Fallback window.open() match inside a single <script> body
+WINDOW_OPEN_RE = re.compile(r'window\.open\(["\'](https?://[^\s"\'\)]+)')
+# Characters Windows refuses in file names
+INVALID_FS_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+# Link prefixes accepted from pastes; str.startswith with a tuple beats a regex match per line
+URL_PREFIXES = ('http://', 'https://')
+DOWNLOAD_EXTENSIONS = ('.zip', '.rar', '.exe', '.iso', '.tar.gz', '.torrent', '.dmg', '.7z', '.gz')
+
+# Per-item download state stored on QListWidgetItems next to the raw URL
+LINK_STATUS_ROLE = Qt.UserRole + 1
+LINK_NORMAL = "normal"
+LINK_PROCESSING = "processing"
+LINK_FAILED = "failed"
+
+_ABS_DOWNLOADS = os.path.abspath(DOWNLOADS_FOLDER)
+os.makedirs(_ABS_DOWNLOADS, exist_ok=True)
+_DOWNLOADS_URL = QUrl.fromLocalFile(_ABS_DOWNLOADS)
+
+# Browser-like defaults (read-only), installed once on each worker's requests.Session; a call that
+# needs an extra or different header (e.g. Range) passes only that via headers=
+HEADERS = MappingProxyType({
     'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
     'accept-language': 'en-US,en;q=0.5',
     'referer': 'https://fitgirl-repacks.site/',
@@ -43,56 +92,101 @@ HEADERS = {
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/131.0.0.0 Safari/537.36"
     ),
-}
+})
+# File transfers ask for the bytes as stored: ranges and Content-Length then refer to the
+# file itself and urllib3 never sets up a decompressor for already-compressed archives
+FILE_HEADERS = MappingProxyType({'Accept-Encoding': 'identity'})
 
 # ---------------------------------------------------------------------------
+def has_download_extension(url):
+    """True if the URL path (query/fragment ignored, any case) ends in a DOWNLOAD_EXTENSIONS suffix."""
+    return url.partition('?')[0].partition('#')[0].lower().endswith(DOWNLOAD_EXTENSIONS)
+
+# Installed font families, enumerated once on first use (needs a QApplication)
+@lru_cache(maxsize=None)
+def available_font_families():
+    """Return the set of installed font families, querying QFontDatabase only once."""
+    return frozenset(QFontDatabase().families())
+
+@lru_cache(maxsize=None)
+def preferred_font_family(candidates, default="Segoe UI"):
+    """Return the first installed family from the candidates tuple, remembered per tuple."""
+    available_fonts = available_font_families()
+    return next((font for font in candidates if font in available_fonts), default)
+
+@lru_cache(maxsize=None)
+def emoji_icon(emoji, size=16):
+    """Render an emoji once into a QIcon, so buttons blit a pixmap instead of re-shaping the glyph on every repaint."""
+    ratio = QtWidgets.QApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    font = QFont(preferred_font_family(
+        ("Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji"),
+        QtWidgets.QApplication.font().family()
+    ))
+    font.setPixelSize(size - 2)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, emoji)
+    painter.end()
+    return QtGui.QIcon(pixmap)
+
+@contextmanager
+def frozen(widget):
+    """Suspend painting and signals on a widget while it is bulk-mutated, then repaint once."""
+    was_enabled = widget.updatesEnabled()
+    was_blocked = widget.blockSignals(True)
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(was_enabled)
+        if was_enabled:
+            widget.viewport().update()
+
+# Log categories in priority order: (group name, keywords/emoji, color, emoji)
+_LOG_CATEGORIES = (
+    ("error", ("error", "❌"), "#FF6347", "❌"),  # Tomato
+    ("completed", ("completed", "✅"), "#32CD32", "✅"),  # LimeGreen
+    ("paused", ("paused", "⏸️"), "#FFD700", "⏸️"),  # Gold
+    ("resumed", ("resumed", "▶️"), "#00BFFF", "▶️"),  # DeepSkyBlue
+    ("downloading", ("downloading", "⬇️"), "#1E90FF", "⬇️"),  # DodgerBlue
+    ("fetching", ("processing link", "fetching", "🔗"), "#40E0D0", "🔗"),  # Turquoise
+    ("loaded", ("loaded", "imported", "📥"), "#DA70D6", "📥"),  # Orchid
+    ("removed", ("removed", "deleted", "🗑️"), "#A9A9A9", "🗑️"),  # DarkGray
+    ("stopping", ("stopping", "stopped", "🛑"), "#FF4500", "🛑"),  # OrangeRed
+)
+
+_LOG_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, keywords))})"
+        for name, keywords, _, _ in _LOG_CATEGORIES
+    ),
+    re.IGNORECASE,
+)
+
+# Group name -> (priority, color, emoji) dispatch table
+_LOG_STYLES = {
+    name: (rank, color, emoji)
+    for rank, (name, _, color, emoji) in enumerate(_LOG_CATEGORIES)
+}
+
 # Helper function to colorize log messages based on content.
 def colorize_log_message(message):
     """
     Return the message wrapped in an HTML span with a color and emoji
     based on keywords in the message.
     """
-    msg_lower = message.lower()
-    emoji = ""
-    
-    if "error" in msg_lower or "❌" in message:
-        color = "#FF6347"  # Tomato
-        if "❌" not in message:
-            emoji = "❌ "
-    elif "completed" in msg_lower or "✅" in message:
-        color = "#32CD32"  # LimeGreen
-        if "✅" not in message:
-            emoji = "✅ "
-    elif "paused" in msg_lower or "⏸️" in message:
-        color = "#FFD700"  # Gold
-        if "⏸️" not in message:
-            emoji = "⏸️ "
-    elif "resumed" in msg_lower or "▶️" in message:
-        color = "#00BFFF"  # DeepSkyBlue
-        if "▶️" not in message:
-            emoji = "▶️ "
-    elif "downloading" in msg_lower or "⬇️" in message:
-        color = "#1E90FF"  # DodgerBlue
-        if "⬇️" not in message:
-            emoji = "⬇️ "
-    elif "processing link" in msg_lower or "fetching" in msg_lower or "🔗" in message:
-        color = "#40E0D0"  # Turquoise
-        if "🔗" not in message:
-            emoji = "🔗 "
-    elif "loaded" in msg_lower or "imported" in msg_lower or "📥" in message:
-        color = "#DA70D6"  # Orchid
-        if "📥" not in message:
-            emoji = "📥 "
-    elif "removed" in msg_lower or "deleted" in msg_lower or "🗑️" in message:
-        color = "#A9A9A9" # DarkGray
-        if "🗑️" not in message:
-            emoji = "🗑️ "
-    elif "stopping" in msg_lower or "stopped" in msg_lower or "🛑" in message:
-        color = "#FF4500" # OrangeRed
-        if "🛑" not in message:
-            emoji = "🛑 "
+    # One pass over the message collects every matching category; the
+    # highest-priority one (earliest in _LOG_CATEGORIES) wins.
+    matched = {m.lastgroup for m in _LOG_KEYWORD_PATTERN.finditer(message)}
+    if matched:
+        _, color, emoji = min(_LOG_STYLES[name] for name in matched)
+        emoji = "" if emoji in message else emoji + " "
     else:
-        color = "#E0E0E0"  # Default to light grey for general messages
+        color, emoji = "#E0E0E0", ""  # Default to light grey for general messages
 
     return f"<span style='color:{color};'>{emoji}{message}</span>"
 
@@ -101,33 +195,43 @@ class AnimatedProgressBar(QtWidgets.QProgressBar):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(35)
+        self._glow_brush = None # Width-dependent, rebuilt in resizeEvent
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        gradient = QLinearGradient(0, 0, self.width() - 2, 0)
+        gradient.setColorAt(0, QColor(64, 224, 208, 30))
+        gradient.setColorAt(0.5, QColor(64, 224, 208, 80))
+        gradient.setColorAt(1, QColor(64, 224, 208, 30))
+        self._glow_brush = QtGui.QBrush(gradient)
         
     def paintEvent(self, event):
         super().paintEvent(event)
         
         # Add subtle glow effect when downloading
-        if self.value() > 0 and self.value() < self.maximum():
+        if self._glow_brush and self.value() > 0 and self.value() < self.maximum():
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Create glow effect
-            glow_rect = self.rect().adjusted(1, 1, -1, -1)
-            gradient = QLinearGradient(0, 0, glow_rect.width(), 0)
-            gradient.setColorAt(0, QColor(64, 224, 208, 30))
-            gradient.setColorAt(0.5, QColor(64, 224, 208, 80))
-            gradient.setColorAt(1, QColor(64, 224, 208, 30))
-            
-            painter.setBrush(gradient)
+            painter.setBrush(self._glow_brush)
             painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(glow_rect, 8, 8)
+            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 8, 8)
 
 # Custom status indicator with animations
 class StatusIndicator(QtWidgets.QLabel):
+    # Built once for the class instead of on every set_status call
+    _STATUS_COLORS = MappingProxyType({
+        "green": QColor("#27AE60"),
+        "blue": QColor("#1E90FF"),
+        "gold": QColor("#FFD700"),
+        "red": QColor("#FF6347"),
+    })
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignCenter)
         self.setMinimumHeight(50)
         self._status_color = QColor("#27AE60")
+        self._color_name = None # Colour the current stylesheet was built for
         
         # Animation for pulsing effect
         self.pulse_animation = QPropertyAnimation(self, b"status_color")
@@ -146,15 +250,9 @@ class StatusIndicator(QtWidgets.QLabel):
     
     def set_status(self, status_text, color_name="green"):
         self.setText(status_text)
-        
-        color_map = {
-            "green": QColor("#27AE60"),
-            "blue": QColor("#1E90FF"), 
-            "gold": QColor("#FFD700"),
-            "red": QColor("#FF6347")
-        }
-        
-        base_color = color_map.get(color_name, QColor("#27AE60"))
+        if color_name not in self._STATUS_COLORS:
+            color_name = "green"
+        base_color = self._STATUS_COLORS[color_name]
         self._status_color = base_color
         
         # Start pulsing animation for active states
@@ -165,7 +263,11 @@ class StatusIndicator(QtWidgets.QLabel):
             self.pulse_animation.start()
         else:
             self.pulse_animation.stop()
-            
+
+        # Same colour as before: keep the sheet rather than repolishing for an identical one
+        if color_name == self._color_name:
+            return
+        self._color_name = color_name
         self.setStyleSheet(f"""
             StatusIndicator {{
                 background-color: {base_color.name()};
@@ -244,13 +346,24 @@ class ResponsiveScrollArea(QtWidgets.QScrollArea):
         """)
 
 # Enhanced list widget with better drag/drop feedback and responsive behavior
+class NumberedItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Shows each item as "N. text" using its current row, so reordering or removing
+    links never has to rewrite the text of every item below."""
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.text = f"{index.row() + 1}. {option.text}"
+
 class QListWidgetLinks(QtWidgets.QListWidget):
     """
     A QListWidget subclass that enables drag-and-drop for URLs
     and provides a context menu for list items with responsive behavior.
     """
-    def __init__(self, parent=None):
+    def __init__(self, main_window, parent=None):
         super().__init__(parent)
+        self._main = main_window # Owner of the download queue; the widget is reparented into layouts
+        # Raw URL -> its list items in insertion order, for O(1) duplicate checks and lookups.
+        # A list because input.txt may repeat a URL and every copy must stay findable.
+        self._items_by_url = {}
         self.setAcceptDrops(True)
         self.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
         self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
@@ -260,6 +373,7 @@ class QListWidgetLinks(QtWidgets.QListWidget):
         self.setAlternatingRowColors(True)
         self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         self.setUniformItemSizes(False)  # Allow dynamic item sizing
+        self.setItemDelegate(NumberedItemDelegate(self)) # Row numbers are painted, not stored
         
         # Drag feedback overlay
         self.drag_overlay = QtWidgets.QLabel(self)
@@ -278,6 +392,38 @@ class QListWidgetLinks(QtWidgets.QListWidget):
         self.drag_overlay.setText("Drop links here!")
         self.drag_overlay.setAlignment(Qt.AlignCenter)
 
+    def add_link(self, link):
+        """Append a link item, keeping the raw URL in Qt.UserRole so the numbered text never needs parsing."""
+        item = QtWidgets.QListWidgetItem(link)
+        item.setData(Qt.UserRole, link)
+        item.setData(LINK_STATUS_ROLE, LINK_NORMAL)
+        self.addItem(item)
+        self._items_by_url.setdefault(link, []).append(item)
+        return item
+
+    def has_link(self, link):
+        return link in self._items_by_url
+
+    def item_for(self, link):
+        """Return the first listed item holding a raw URL, or None if it is not listed."""
+        items = self._items_by_url.get(link)
+        return items[0] if items else None
+
+    def takeItem(self, row):
+        item = super().takeItem(row)
+        if item is not None:
+            link = item.data(Qt.UserRole)
+            items = self._items_by_url.get(link)
+            if items:
+                items[:] = [listed for listed in items if listed is not item]
+                if not items:
+                    del self._items_by_url[link]
+        return item
+
+    def clear(self):
+        super().clear()
+        self._items_by_url.clear()
+
     def resizeEvent(self, event: QtGui.QResizeEvent):
         super().resizeEvent(event)
         self.current_width = self.width()
@@ -295,13 +441,13 @@ class QListWidgetLinks(QtWidgets.QListWidget):
         # Responsive button text
         if hasattr(self, 'download_btn'):
             if self.current_width < 600:
-                self.download_btn.setText("🚀 Download")
-                self.add_links_btn.setText("➕ Add")
-                self.open_downloads_btn.setText("📁 Files")
+                self.download_btn.setText("Download")
+                self.add_links_btn.setText("Add")
+                self.open_downloads_btn.setText("Files")
             else:
-                self.download_btn.setText("🚀 Download All")
-                self.add_links_btn.setText("➕ Add Links")
-                self.open_downloads_btn.setText("📁 Downloads")
+                self.download_btn.setText("Download All")
+                self.add_links_btn.setText("Add Links")
+                self.open_downloads_btn.setText("Downloads")
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -325,19 +471,22 @@ class QListWidgetLinks(QtWidgets.QListWidget):
         self.drag_overlay.hide()
         if event.mimeData().hasUrls():
             links_added = 0
-            for url in event.mimeData().urls():
-                if url.scheme() in ('http', 'https'):
-                    item_text = url.toString()
-                    # Prevent adding duplicates by checking the link part after numbering
-                    if not any(self.item(i).text().split(". ", 1)[-1] == item_text for i in range(self.count())):
-                        self.addItem(item_text)
-                        # Also add to the main window's download queue
-                        self.parent().parent().download_queue.append(item_text)
-                        links_added += 1
+            # One repaint for the whole drop, however many URLs it carries
+            with frozen(self):
+                for url in event.mimeData().urls():
+                    if url.scheme() in ('http', 'https'):
+                        item_text = url.toString()
+                        # Skip duplicates with an O(1) has_link() lookup in the URL index
+                        if not self.has_link(item_text):
+                            self.add_link(item_text)
+                            # Also add to the main window's download queue
+                            self._main.download_queue.append(item_text)
+                            links_added += 1
+                if links_added > 0:
+                    self._main.update_link_numbers()
             if links_added > 0:
-                self.parent().parent().log(f"📥 Added {links_added} link(s) via drag & drop.")
-                self.parent().parent().update_link_numbers()
-                self.parent().parent()._update_input_file()
+                self._main.log(f"📥 Added {links_added} link(s) via drag & drop.")
+                self._main._update_input_file()
             event.acceptProposedAction()
         else:
             super().dropEvent(event)
@@ -371,22 +520,24 @@ class QListWidgetLinks(QtWidgets.QListWidget):
 
         if action == copy_action:
             if self.currentItem():
-                self.parent().parent().copy_link_to_clipboard(self.currentItem())
+                self._main.copy_link_to_clipboard(self.currentItem())
         elif action == open_action:
             selected_items = self.selectedItems()
             if selected_items:
-                link = selected_items[0].text().split(". ", 1)[-1]
+                link = selected_items[0].data(Qt.UserRole)
                 QDesktopServices.openUrl(QUrl(link))
-                self.parent().parent().log(f"🌐 Opening link: {link[:50]}...")
+                self._main.log(f"🌐 Opening link: {link[:50]}...")
         elif action == remove_action:
-            self.parent().parent().remove_selected_links()
+            self._main.remove_selected_links()
         elif action == clear_all_action:
-            self.parent().parent().clear_all_links()
+            self._main.clear_all_links()
 
 # Enhanced button with hover animations and responsive sizing
 class AnimatedButton(QtWidgets.QPushButton):
-    def __init__(self, text="", parent=None):
+    def __init__(self, text="", parent=None, emoji=None):
         super().__init__(text, parent)
+        if emoji:
+            self.setIcon(emoji_icon(emoji))
         self.setCursor(Qt.PointingHandCursor)
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         
@@ -447,26 +598,74 @@ class ResponsiveWidget(QtWidgets.QWidget):
         # Override in subclasses to implement responsive behavior
         pass
 
+class DownloadStopped(RuntimeError):
+    """Raised in chunk workers once the session is stopped; ends the chunk without a retry."""
+
+class AdaptiveLimiter:
+    """
+    Concurrency gate whose limit can be raised or lowered while tasks are queued on it.
+    """
+    def __init__(self, limit):
+        self._cond = threading.Condition()
+        self._limit = limit
+        self._active = 0
+        self._aborted = False
+
+    @property
+    def limit(self):
+        return self._limit
+
+    def set_limit(self, limit):
+        with self._cond:
+            self._limit = limit
+            self._cond.notify_all()
+
+    def abort(self):
+        """Release every task waiting for a slot; they raise DownloadStopped instead of entering."""
+        with self._cond:
+            self._aborted = True
+            self._cond.notify_all()
+
+    def __enter__(self):
+        with self._cond:
+            while self._active >= self._limit and not self._aborted:
+                self._cond.wait()
+            if self._aborted:
+                raise DownloadStopped("Download stopped while waiting for a chunk slot.")
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+        return False
+
 # ----------------------- GUI Code -----------------------
 class DownloaderWorker(QThread):
     """
     Thread-safe worker with proper signal handling for downloading files.
     """
-    log_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int, int) # downloaded_bytes, total_bytes
+    log_ready_signal = pyqtSignal() # lines are waiting in log_buffer; emitted once per batch
+    progress_signal = pyqtSignal(int, int, float, float, float) # downloaded_bytes, total_bytes, current_speed, overall_speed, eta_seconds
     file_signal = pyqtSignal(str) # current filename
     status_signal = pyqtSignal(str) # overall status text
-    speed_signal = pyqtSignal(float, float, float) # current_speed, overall_speed, eta_seconds
     link_completed_signal = pyqtSignal(str) # link that finished successfully
     link_failed_signal = pyqtSignal(str, str) # link, error_message
     session_finished_signal = pyqtSignal(list, list) # completed_links, failed_links
     link_processing_signal = pyqtSignal(str) # Signal for when a link starts processing
+    chunk_workers_tuned_signal = pyqtSignal(str, int) # host, chunk concurrency that performed best
 
-    def __init__(self, links, parent=None):
+    def __init__(self, links, chunk_workers=None, parent=None):
         super().__init__(parent)
         self.links = links
-        self._is_paused = False
-        self._lock = QMutex()
+        self.chunk_workers = dict(chunk_workers or {}) # host -> learned chunk concurrency
+        # Set while running; cleared by pause() so every download thread blocks in wait()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._stop_event = threading.Event() # Interrupts retry back-off sleeps on stop()
+        self._chunk_limiter = None # AdaptiveLimiter of the file being chunk-downloaded
+        self._pause_lock = threading.Lock() # Guards the paused-time accounting only
         self.active = True # Controls the main loop and threads
         self.current_download_url = None # To potentially allow stopping current download
         
@@ -478,94 +677,153 @@ class DownloaderWorker(QThread):
         self.last_update_time = 0.0
         self.last_downloaded_bytes = 0
         self.total_paused_duration = 0.0
-        self.pause_start_time = 0.0
+        self.pause_start_time = None
         # Added for less frequent log updates of progress
         self.last_log_time = 0.0 
         self.last_logged_bytes = 0
-
+        self._last_signal_emit = 0.0 # Progress/speed signals are capped at ~10 Hz
+        # Log lines from every download thread; the GUI drains them in batches
+        self.log_buffer = deque(maxlen=1000)
+        self._log_pending = False
+
+        # One pooled session for every request so chunks and probes reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_CHUNK_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Chunk threads are created once per session and reused for every file
+        self._chunk_executor = ThreadPoolExecutor(max_workers=MAX_CHUNK_WORKERS, thread_name_prefix='chunk')
+
+
+    def _log(self, message):
+        """Queue a log line; the GUI thread is woken only if no drain is already pending."""
+        self.log_buffer.append(message)
+        if not self._log_pending:
+            self._log_pending = True
+            self.log_ready_signal.emit()
+
+    def drain_logs(self):
+        """GUI thread: take every queued line. The flag is cleared first so a line
+        queued mid-drain either gets drained now or triggers a fresh signal."""
+        self._log_pending = False
+        lines = []
+        while self.log_buffer:
+            lines.append(self.log_buffer.popleft())
+        return lines
 
     def pause(self):
-        with QMutexLocker(self._lock):
-            self._is_paused = True
-            self.pause_start_time = time.time() # Record pause start time
+        with self._pause_lock:
+            if self._resume_event.is_set():
+                self.pause_start_time = time.monotonic() # Record pause start time
+                self._resume_event.clear()
         self.status_signal.emit("Paused")
-        self.log_signal.emit("⏸ Download paused.")
+        self._log("⏸ Download paused.")
+
+    def _release_pause(self):
+        """Wake every thread blocked on the resume event, accounting the paused time."""
+        with self._pause_lock:
+            if not self._resume_event.is_set():
+                if self.pause_start_time is not None: # None if a new file reset the accounting mid-pause
+                    self.total_paused_duration += (time.monotonic() - self.pause_start_time)
+                self.pause_start_time = None # Reset pause start time
+                self._resume_event.set()
 
     def resume_download(self):
-        with QMutexLocker(self._lock):
-            if self._is_paused:
-                self.total_paused_duration += (time.time() - self.pause_start_time)
-            self._is_paused = False
-            self.pause_start_time = 0.0 # Reset pause start time
+        self._release_pause()
         self.status_signal.emit("Resuming...")
-        self.log_signal.emit("▶ Download resumed.")
+        self._log("▶ Download resumed.")
 
-    def stop(self):
+    def request_stop(self):
+        """Ask the session to end without waiting for it; run() cleans up and emits finished."""
         self.active = False
-        # Wake up any sleeping threads if paused
-        self.resume_download()  # This will also update total_paused_duration if it was paused
+        self._stop_event.set()
+        # Wake up any threads blocked while paused; they see active=False and bail out
+        self._release_pause()
+        # Chunks still queued for a limiter slot are running executor tasks, so cancel() can't reach them
+        limiter = self._chunk_limiter
+        if limiter is not None:
+            limiter.abort()
+
+    def stop(self):
+        self.request_stop()
         # Wait for the thread to finish cleanly, with a timeout
         if self.isRunning():
             self.wait(2000) # Wait up to 2 seconds for clean exit
             if self.isRunning(): # If still running, force termination
                 self.terminate()
                 self.wait(500)
-        self.log_signal.emit("🛑 Download worker stopped.")
+        self._chunk_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        self._log("🛑 Download worker stopped.")
 
 
     def run(self):
         """Main thread entry point with detailed logging"""
-        self.log_signal.emit("🚀 Starting download session...")
+        self._log("🚀 Starting download session...")
         self.status_signal.emit("Starting...")
-        start_session = time.time()
+        start_session = time.monotonic()
         
-        # Operate on a copy of links for iteration to allow modifications to original self.links
-        current_links_to_process = self.links[:]
+        # Operate on a copy of links for iteration to allow modifications to original self.links.
+        # Links from the same host are kept together (stable sort) so pooled connections are reused.
+        current_links_to_process = sorted(self.links, key=lambda u: urlparse(u).netloc)
+        if current_links_to_process != self.links:
+            self._log("🔀 Grouped links by host to reuse connections; the list order is unchanged.")
+
+        # Page fetching is latency-bound, so upcoming links are resolved in the
+        # background while the current file (already chunk-parallel) downloads.
+        resolver = ThreadPoolExecutor(max_workers=RESOLVE_AHEAD)
+        resolving = {} # link index -> future of (file_name, download_url)
         
         for idx, link in enumerate(current_links_to_process, 1):
             if not self.active:
-                self.log_signal.emit("Session interrupted.")
+                self._log("Session interrupted.")
                 break
             
-            self.log_signal.emit(
+            self._log(
                 f"🔗 Processing link {idx}/{len(current_links_to_process)}\n"
                 f"    URL: {link[:70]}{'...' if len(link) > 70 else ''}"
             )
             self.status_signal.emit(f"Fetching: {link[:30]}...")
             self.link_processing_signal.emit(link) # Signal that this link is now being processed
 
+            for ahead in range(idx, min(idx + RESOLVE_AHEAD, len(current_links_to_process)) + 1):
+                if ahead not in resolving:
+                    resolving[ahead] = resolver.submit(self._process_link, current_links_to_process[ahead - 1])
+
             try:
                 # Pause mechanism check before processing each link
-                while self.should_pause() and self.active:
-                    time.sleep(0.1)
+                self._resume_event.wait()
                 if not self.active: break # Check again after pause
 
-                file_name, download_url = self._process_link(link)
-                self.current_download_url = download_url # Store for potential external stop
+                file_name, download_url = resolving.pop(idx).result()
                 output_path = os.path.join(DOWNLOADS_FOLDER, file_name)
                 
-                remote_size_mb = self._get_remote_size(download_url)
-                self.log_signal.emit(
+                download_url, total_size, accept_ranges = self._probe_remote(download_url)
+                self.current_download_url = download_url # Store for potential external stop
+                self._log(
                     f"📁 File identified\n"
                     f"    Name: {file_name}\n"
-                    f"    Size: {remote_size_mb:.2f} MB"
+                    f"    Size: {total_size / (1024 * 1024):.2f} MB"
                 )
                 self.file_signal.emit(file_name) # Update UI with current file
                 
-                self.dl_start_time = time.time() # Reset for each new download
+                self.dl_start_time = time.monotonic() # Reset for each new download
                 self.last_update_time = self.dl_start_time
                 self.last_downloaded_bytes = 0
                 self.total_paused_duration = 0.0
-                self.pause_start_time = 0.0
+                self.pause_start_time = None
                 self.last_log_time = self.dl_start_time # Initialize log timing
                 self.last_logged_bytes = 0
+                self._last_signal_emit = 0.0
 
 
-                self._download_file(download_url, output_path)
+                self._download_file(download_url, output_path, total_size, accept_ranges)
                 
-                self.log_signal.emit(
+                self._log(
                     f"✅ Download completed\n"
-                    f"    Time: {time.time() - self.dl_start_time - self.total_paused_duration:.1f}s\n"
+                    f"    Time: {time.monotonic() - self.dl_start_time - self.total_paused_duration:.1f}s\n"
                     f"    Path: {output_path}"
                 )
                 self.link_completed_signal.emit(link) # Signal successful completion
@@ -573,46 +831,47 @@ class DownloaderWorker(QThread):
                 
             except requests.exceptions.RequestException as e:
                 error_msg = f"Network error: {e}"
-                self.log_signal.emit(f"❌ Error for {link[:50]}...: {error_msg}")
+                self._log(f"❌ Error for {link[:50]}...: {error_msg}")
                 self.link_failed_signal.emit(link, error_msg)
                 self.failed_links.append(link)
             except Exception as e:
                 error_msg = f"General error: {e}"
-                self.log_signal.emit(f"❌ Error for {link[:50]}...: {error_msg}")
+                self._log(f"❌ Error for {link[:50]}...: {error_msg}")
                 self.link_failed_signal.emit(link, error_msg)
                 self.failed_links.append(link)
             finally:
                 self.current_download_url = None # Clear current download reference
-                self.progress_signal.emit(0, 0) # Reset progress bar for next item
+                self.progress_signal.emit(0, 0, 0.0, 0.0, 0.0) # Reset progress bar for next item
+
+        resolver.shutdown(wait=False, cancel_futures=True)
 
-        total_time = time.time() - start_session
-        self.log_signal.emit(
+        total_time = time.monotonic() - start_session
+        self._log(
             f"🏁 Session finished\n"
             f"    Duration: {total_time:.1f}s\n"
             f"    Processed: {len(current_links_to_process)} files"
         )
+        self._chunk_executor.shutdown(wait=False)
+        self.session.close()
         self.status_signal.emit("Idle")
         self.session_finished_signal.emit(self.completed_links, self.failed_links) # Signal that the entire session is done
 
 
-    def _get_remote_size(self, url):
-        """Get file size in megabytes, safely handles missing header"""
+    def _probe_remote(self, url):
+        """
+        Single HEAD request returning (final URL, size in bytes, whether byte ranges are supported).
+        Redirects are followed here once so the chunk GETs go straight to the final host's pool.
+        """
         try:
-            head = requests.head(url, headers=HEADERS, timeout=10)
-            content_length = head.headers.get('content-length')
-            if content_length:
-                size_bytes = int(content_length)
-                return size_bytes / (1024 * 1024)
-            return 0.0 # Return 0 if content-length is missing
-        except requests.RequestException:
-            return 0.0 # Return 0 on network errors
-
-    def _download_file(self, url, path):
+            head = self.session.head(url, headers=FILE_HEADERS, allow_redirects=True, timeout=10)
+            total_size = int(head.headers.get('content-length', 0)) # 0 if content-length is missing
+            accept_ranges = 'bytes' in head.headers.get('Accept-Ranges', '')
+            return head.url, total_size, accept_ranges
+        except (requests.RequestException, ValueError):
+            return url, 0, False # Unknown size; the single-thread download will surface real errors
+
+    def _download_file(self, url, path, total_size, accept_ranges):
         """Download dispatcher with enhanced speed tracking"""
-        head = requests.head(url, headers=HEADERS, timeout=10)
-        total_size = int(head.headers.get('content-length', 0))
-        accept_ranges = 'bytes' in head.headers.get('Accept-Ranges', '')
-        
         self.status_signal.emit(f"Downloading: {os.path.basename(path)}")
 
         if total_size > 0 and total_size > 1024 * 1024 and accept_ranges:  # Multi-thread for >1MB
@@ -624,14 +883,6 @@ class DownloaderWorker(QThread):
     def _chunked_download(self, url, path, total_size):
         """Threaded download with accurate speed updates"""
         chunk_size = 4 * 1024 * 1024  # 4MB chunks
-        # Ensure path exists and pre-allocate file size for random access
-        try:
-            with open(path, 'wb') as f:
-                f.truncate(total_size)
-        except OSError as e:
-            self.log_signal.emit(f"❌ Error pre-allocating file {path}: {e}")
-            raise # Re-raise to be caught by the main run loop
-
         chunks_to_download = []
         for start in range(0, total_size, chunk_size):
             end = min(start + chunk_size - 1, total_size - 1)
@@ -640,61 +891,159 @@ class DownloaderWorker(QThread):
         # Use a list to track downloaded bytes for each chunk
         chunk_downloaded_bytes = [0] * len(chunks_to_download)
         
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(
-                self._download_chunk,
-                url, start, end, path, i # Pass index i
+        # Concurrency starts from what worked last time for this host and is tuned as we go
+        host = urlparse(url).hostname or ""
+        self._chunk_limiter = AdaptiveLimiter(self.chunk_workers.get(host, MAX_WORKERS))
+        self._reset_tuning()
+
+        # Create and pre-allocate the file once; every chunk writes straight to its own offset
+        with self._open_chunk_writer(path, total_size) as write_at:
+            futures = {self._chunk_executor.submit(
+                self._limited_chunk,
+                url, start, end, write_at, i, chunk_downloaded_bytes # Pass index i
             ): i for i, (start, end) in enumerate(chunks_to_download)}
 
-            downloaded = 0
-            while downloaded < total_size and self.active:
-                # Update progress more frequently than just on chunk completion
-                current_downloaded = sum(chunk_downloaded_bytes)
-                self._update_speed_metrics(current_downloaded, total_size)
-                
-                # Check for completed futures
-                # Iterate through a copy to allow modification if retrying
-                completed_futures = []
-                for future in list(futures.keys()): # Iterate over a copy of keys
-                    if future.done():
-                        completed_futures.append(future)
-                        
-                for future in completed_futures:
-                    if not self.active: break
-                    chunk_index = futures.pop(future) # Remove from active futures
+            pending = set(futures)
+            failed_chunks = 0
+            while pending and self.active:
+                # Block until a chunk finishes or it's time for the next progress update
+                done, pending = wait_futures(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk_index = futures[future]
                     try:
-                        chunk_bytes_downloaded = future.result()
-                        chunk_downloaded_bytes[chunk_index] = chunk_bytes_downloaded
-                        downloaded = sum(chunk_downloaded_bytes) # Update total downloaded
+                        chunk_downloaded_bytes[chunk_index] = future.result()
+                    except DownloadStopped:
+                        pass # Stopped, not failed; the loop exits on the next active check
                     except Exception as e:
+                        failed_chunks += 1
                         range_info = chunks_to_download[chunk_index]
-                        self.log_signal.emit(f"⚠️ Chunk ({range_info[0]}-{range_info[1]}) failed: {str(e)}")
-                        # For robustness, you might re-submit failed chunks here.
-                        # For simplicity, we just log and continue, marking it as potentially incomplete if not handled.
-                
-                if not self.active:
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    self.log_signal.emit("Download cancelled during chunk processing.")
-                    break
+                        self._log(f"⚠️ Chunk ({range_info[0]}-{range_info[1]}) failed: {str(e)}")
 
-                while self.should_pause() and self.active:
-                    time.sleep(0.1)
+                if self.should_pause():
+                    self._resume_event.wait()
+                    self._reset_tuning() # Paused time would read as a throughput drop
                 if not self.active:
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    self.log_signal.emit("Download cancelled during pause.")
                     break
-                
-                # Small sleep to prevent busy-waiting if no futures are done yet
-                if not completed_futures and self.active:
-                    time.sleep(0.05)
 
+                # Chunks update their own slot per block, so this includes partial chunks
+                current_downloaded = sum(chunk_downloaded_bytes)
+                self._update_speed_metrics(current_downloaded, total_size)
+                self._tune_chunk_workers(current_downloaded)
 
-            if self.active: # Only if not explicitly stopped
+            if not self.active:
+                for future in pending:
+                    future.cancel()
+                wait_futures(pending) # Chunks already running must stop writing before the file closes
+                self._log("Download cancelled during chunk processing.")
+            elif failed_chunks:
+                raise Exception(f"{failed_chunks} chunk(s) failed; the file is incomplete.")
+            else:
                 self._update_speed_metrics(total_size, total_size) # Ensure 100% update
 
+        if self.active and not failed_chunks and self._chunk_limiter.limit != self.chunk_workers.get(host):
+            self.chunk_workers[host] = self._chunk_limiter.limit
+            self.chunk_workers_tuned_signal.emit(host, self._chunk_limiter.limit)
+
+    @contextmanager
+    def _open_chunk_writer(self, path, total_size):
+        """Create path at total_size and yield write_at(offset, data) for it.
+
+        Uses positional os.pwrite where available; Windows has no pwrite, so the
+        file is memory-mapped there instead. Neither needs a shared file position.
+        """
+        with open(path, 'w+b') as f:
+            try:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size) # Reserve real blocks up front
+                except AttributeError: # Not available on Windows
+                    f.truncate(total_size)
+                except OSError as e:
+                    if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL): # e.g. disk full
+                        raise
+                    f.truncate(total_size) # Filesystem can't reserve blocks
+            except OSError as e:
+                self._log(f"❌ Error pre-allocating file {path}: {e}")
+                raise # Re-raise to be caught by the main run loop
+
+            if hasattr(os, 'pwrite'):
+                fd = f.fileno()
+
+                def write_at(offset, data):
+                    view = memoryview(data)
+                    while view: # Regular files rarely short-write, but pwrite may
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+
+                yield write_at
+            else:
+                with mmap.mmap(f.fileno(), total_size) as file_map:
+                    def write_at(offset, data):
+                        file_map[offset:offset + len(data)] = data
+
+                    yield write_at
+
+    def _limited_chunk(self, *args):
+        """Run _download_chunk once the adaptive limiter grants a slot."""
+        with self._chunk_limiter:
+            return self._download_chunk(*args)
+
+    def _reset_tuning(self):
+        """Start a fresh throughput window; the first one after a (re)start is warm-up only."""
+        self._tune_window_start = time.monotonic()
+        self._tune_window_bytes = None
+        self._tune_last_rate = None
+        self._tune_last_step = 0
+        self._tune_settled = False
+
+    def _tune_chunk_workers(self, downloaded_bytes):
+        """
+        Hill-climb the chunk concurrency: every TUNE_WINDOW seconds move two workers
+        in the direction that keeps throughput improving by 5%+. When throughput stays
+        flat the host is throttling per connection, so workers are given back; the
+        first step that makes throughput drop is undone and the limit then stays put.
+        """
+        now = time.monotonic()
+        if self._tune_window_bytes is None: # Warm-up window (TCP slow start) just ended
+            if now - self._tune_window_start >= TUNE_WINDOW:
+                self._tune_window_start, self._tune_window_bytes = now, downloaded_bytes
+            return
+        elapsed = now - self._tune_window_start
+        if elapsed < TUNE_WINDOW:
+            return
+
+        rate = (downloaded_bytes - self._tune_window_bytes) / elapsed
+        limit = self._chunk_limiter.limit
+        last_step = self._tune_last_step
+        step = 0
+        if self._tune_settled:
+            pass
+        elif self._tune_last_rate is None:
+            step = 2
+        elif rate > self._tune_last_rate * 1.05:
+            step = last_step or 2 # Keep going the way that helped
+        elif rate < self._tune_last_rate * 0.95:
+            step = -last_step # Undo what hurt and stop exploring
+            self._tune_settled = True
+        elif last_step > 0:
+            step = -last_step # Flat: the extra workers bought nothing
+        elif last_step < 0:
+            step = -2 # Flat with fewer workers: keep trimming
+        new_limit = max(MIN_CHUNK_WORKERS, min(MAX_CHUNK_WORKERS, limit + step))
+        if new_limit != limit:
+            self._chunk_limiter.set_limit(new_limit)
+            self._log(f"⚙️ Chunk workers {limit} → {new_limit} ({self._format_speed(rate)})")
+
+        self._tune_last_step = new_limit - limit
+        self._tune_last_rate = rate
+        self._tune_window_start, self._tune_window_bytes = now, downloaded_bytes
+
     def _update_speed_metrics(self, downloaded_bytes, total_bytes):
         """Calculate and emit speed/progress updates"""
-        now = time.time()
+        now = time.monotonic()
+        if now - self._last_signal_emit < 0.1 and downloaded_bytes != total_bytes:
+            return # The final 100% update always goes through
+        self._last_signal_emit = now
         
         elapsed_time = now - self.dl_start_time - self.total_paused_duration
         
@@ -710,16 +1059,15 @@ class DownloaderWorker(QThread):
         remaining_bytes = total_bytes - downloaded_bytes
         eta_seconds = remaining_bytes / overall_speed_bps if overall_speed_bps > 0 else 0
 
-        self.progress_signal.emit(downloaded_bytes, total_bytes)
-        self.speed_signal.emit(current_speed_bps, overall_speed_bps, eta_seconds)
+        self.progress_signal.emit(downloaded_bytes, total_bytes, current_speed_bps, overall_speed_bps, eta_seconds)
 
-        # Log to QTextEdit less frequently for readability
+        # Log to the activity panel less frequently for readability
         # Log only if a significant amount downloaded or 5 seconds passed or on completion
         if (downloaded_bytes - self.last_logged_bytes) > (1024 * 1024) * 5 or \
            (now - self.last_log_time) > 5.0 or \
            downloaded_bytes == total_bytes:
             
-            self.log_signal.emit(
+            self._log(
                 f"⬇️ Progress: {self._format_bytes(downloaded_bytes)}/{self._format_bytes(total_bytes)} "
                 f"Speed: {self._format_speed(overall_speed_bps)} ETA: {self._format_eta(eta_seconds)}"
             )
@@ -727,27 +1075,21 @@ class DownloaderWorker(QThread):
             self.last_logged_bytes = downloaded_bytes
 
 
+    _BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+    @staticmethod
+    def _format_scaled(value, suffix=""):
+        """Scale by the power of 1024 taken from the integer bit length instead of a comparison chain"""
+        idx = min((int(value).bit_length() - 1) // 10, 4) if value >= 1024 else 0
+        return f"{value / (1 << (idx * 10)):.2f} {DownloaderWorker._BYTE_UNITS[idx]}{suffix}"
+
     def _format_bytes(self, bytes_val):
         """Formats bytes into human-readable KBs, MBs, GBs"""
-        if bytes_val < 1024:
-            return f"{bytes_val:.2f} B"
-        elif bytes_val < 1024 * 1024:
-            return f"{bytes_val / 1024:.2f} KB"
-        elif bytes_val < 1024 * 1024 * 1024:
-            return f"{bytes_val / (1024 * 1024):.2f} MB"
-        else:
-            return f"{bytes_val / (1024 * 1024 * 1024):.2f} GB"
+        return self._format_scaled(bytes_val)
 
     def _format_speed(self, bytes_per_sec):
         """Formats speed into human-readable KB/s, MB/s, GB/s"""
-        if bytes_per_sec < 1024:
-            return f"{bytes_per_sec:.2f} B/s"
-        elif bytes_per_sec < 1024 * 1024:
-            return f"{bytes_per_sec / 1024:.2f} KB/s"
-        elif bytes_per_sec < 1024 * 1024 * 1024:
-            return f"{bytes_per_sec / (1024 * 1024):.2f} MB/s"
-        else:
-            return f"{bytes_per_sec / (1024 * 1024 * 1024):.2f} GB/s"
+        return self._format_scaled(bytes_per_sec, "/s")
 
     def _format_eta(self, seconds):
         """Convert seconds to human-readable ETA"""
@@ -763,80 +1105,79 @@ class DownloaderWorker(QThread):
         else:
             return f"{seconds:02d}s"
 
-    def _download_chunk(self, url, start, end, path, chunk_index):
-        """Chunk downloader with detailed logging and retry logic"""
+    def _download_chunk(self, url, start, end, write_at, chunk_index, progress):
+        """Chunk downloader with detailed logging and retry logic.
+
+        Each block is written straight to its file offset through write_at, so
+        nothing is buffered per chunk; progress[chunk_index] holds the bytes so far.
+        """
+        headers = {**FILE_HEADERS, 'Range': f'bytes={start}-{end}'} # Built once; merged with the session headers
         for attempt in range(3):
             try:
-                while self.should_pause() and self.active:
-                    self.total_paused_duration += (time.time() - self.pause_start_time) if self.pause_start_time else 0
-                    self.pause_start_time = time.time() # Update pause start time
-                    time.sleep(0.1)
-                    if not self.active:  # Important: if the worker is stopped while paused, break
-                        raise RuntimeError("Download stopped during pause.")
-                
-                # If unpaused, reset pause_start_time so it doesn't accumulate future non-paused time
-                if not self.should_pause() and self.pause_start_time != 0.0:
-                    self.total_paused_duration += (time.time() - self.pause_start_time)
-                    self.pause_start_time = 0.0
-
+                self._resume_event.wait() # Paused time is accounted for by pause()/resume_download()
                 if not self.active:  # Check if stopped after pause loop
-                    raise RuntimeError("Download stopped.")
-
-                headers = HEADERS.copy()
-                headers['Range'] = f'bytes={start}-{end}'
-                
-                response = requests.get(url, headers=headers, stream=True, timeout=15)
-                response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-                
-                chunk_data = bytearray()
-                for data in response.iter_content(1024 * 256):  # 256KB blocks
-                    if not self.active: raise RuntimeError("Download stopped during chunk data reception.")
-                    while self.should_pause():
-                        self.total_paused_duration += (time.time() - self.pause_start_time) if self.pause_start_time else 0
-                        self.pause_start_time = time.time() # Update pause start time
-                        time.sleep(0.1)
-                        if not self.active: raise RuntimeError("Download stopped during pause.")
-                    
-                    if not self.should_pause() and self.pause_start_time != 0.0:
-                        self.total_paused_duration += (time.time() - self.pause_start_time)
-                        self.pause_start_time = 0.0
-
-                    chunk_data.extend(data)
-                
-                with open(path, 'r+b') as f:
-                    f.seek(start)
-                    f.write(chunk_data)
+                    raise DownloadStopped("Download stopped.")
+
+                # Closing the response hands the connection back to the pool even if we bail out early
+                with self.session.get(url, headers=headers, stream=True, timeout=15) as response:
+                    response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+
+                    received = 0
+                    progress[chunk_index] = 0 # A retry starts the range over
+                    for data in response.iter_content(1024 * 1024):  # 1MB blocks, a quarter of a chunk
+                        self._resume_event.wait()
+                        if not self.active: raise DownloadStopped("Download stopped during chunk data reception.")
+
+                        offset = start + received
+                        if offset + len(data) > end + 1:
+                            raise RuntimeError("Server sent more data than the requested range.")
+                        write_at(offset, data)
+                        received += len(data)
+                        progress[chunk_index] = received
                 
-                return len(chunk_data) # Return bytes downloaded for this chunk
+                return received # Return bytes downloaded for this chunk
                 
+            except DownloadStopped:
+                raise # A stop is not a failure: no retry, no error log
             except requests.exceptions.RequestException as e:
                 if attempt == 2:
-                    self.log_signal.emit(f"❌ Chunk {chunk_index+1} failed after 3 attempts due to network error: {str(e)}")
-                    raise # Re-raise to be caught by as_completed
+                    self._log(f"❌ Chunk {chunk_index+1} failed after 3 attempts due to network error: {str(e)}")
+                    raise # Re-raise; the chunk wait loop records the failed future
                 
-                self.log_signal.emit(
+                self._log(
                     f"🔄 Retrying chunk {chunk_index+1} (attempt {attempt+1}/3) - Network error: {str(e)}"
                 )
-                time.sleep(1 + attempt) # Exponential backoff
+                self._stop_event.wait(self._retry_delay(attempt)) # Stop cuts the back-off short
             except Exception as e:
                 if attempt == 2:
-                    self.log_signal.emit(f"❌ Chunk {chunk_index+1} failed after 3 attempts: {str(e)}")
-                    raise # Re-raise to be caught by as_completed
+                    self._log(f"❌ Chunk {chunk_index+1} failed after 3 attempts: {str(e)}")
+                    raise # Re-raise; the chunk wait loop records the failed future
                 
-                self.log_signal.emit(
+                self._log(
                     f"🔄 Retrying chunk {chunk_index+1} (attempt {attempt+1}/3) - Error: {str(e)}"
                 )
-                time.sleep(1 + attempt) # Exponential backoff
+                self._stop_event.wait(self._retry_delay(attempt)) # Stop cuts the back-off short
         return 0 # Should not reach here if exceptions are re-raised
 
+    @staticmethod
+    def _retry_delay(attempt):
+        """Exponential back-off with jitter so failed chunks don't all retry in lockstep"""
+        return min(8.0, (1 << attempt) * 0.5 + random.random())
+
     def _process_link(self, link):
         """Safe link processing (HTTP request, parsing, etc.)"""
-        self.log_signal.emit(f"🔗 Fetching content for: {link[:60]}...")
+        self._log(f"🔗 Fetching content for: {link[:60]}...")
         
-        response = requests.get(link, headers=HEADERS, timeout=30)
+        response = self.session.get(link, timeout=30)
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = response.content # Raw bytes; lxml detects the charset itself
+        match = DOWNLOAD_SCRIPT_RE.search(html)
+        if match:
+            # Fast path: the URL came straight from the script, so only the title tags need a tree
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(['meta', 'title']))
+        else:
+            soup = BeautifulSoup(html, HTML_PARSER)
         
         # Enhanced filename extraction
         file_name = self._extract_filename(soup, link)
@@ -844,7 +1185,7 @@ class DownloaderWorker(QThread):
             raise Exception("Could not determine a filename from the link/page.")
 
         # Enhanced download URL extraction
-        download_url = self._extract_download_url(soup, link)
+        download_url = match.group(1).decode('utf-8', 'replace') if match else self._extract_download_url(soup, link)
         if not download_url:
             raise Exception("No direct download URL found on the page.")
         
@@ -855,7 +1196,7 @@ class DownloaderWorker(QThread):
         downloaded = 0
         
         try:
-            with requests.get(url, stream=True, timeout=15) as response:
+            with self.session.get(url, headers=FILE_HEADERS, stream=True, timeout=15) as response:
                 response.raise_for_status()
                 # If total_size was not determined by HEAD request, try to get it now
                 if total_size == 0:
@@ -863,20 +1204,11 @@ class DownloaderWorker(QThread):
 
                 with open(path, 'wb') as f:
                     for data in response.iter_content(1024 * 1024):  # 1MB chunks
+                        self._resume_event.wait()
                         if not self.active:
-                            self.log_signal.emit("Single-thread download cancelled.")
+                            self._log("Single-thread download cancelled.")
                             break
 
-                        while self.should_pause():
-                            self.total_paused_duration += (time.time() - self.pause_start_time) if self.pause_start_time else 0
-                            self.pause_start_time = time.time()
-                            time.sleep(0.1)
-                            if not self.active: break # Check if stopped while paused
-
-                        if not self.should_pause() and self.pause_start_time != 0.0:
-                            self.total_paused_duration += (time.time() - self.pause_start_time)
-                            self.pause_start_time = 0.0
-
                         f.write(data)
                         downloaded += len(data)
                         
@@ -885,15 +1217,15 @@ class DownloaderWorker(QThread):
                 if self.active: # Only update to 100% if not cancelled
                     self._update_speed_metrics(total_size, total_size)
         except requests.exceptions.RequestException as e:
-            self.log_signal.emit(f"❌ Single-thread download failed: {str(e)}")
+            self._log(f"❌ Single-thread download failed: {str(e)}")
             raise # Re-raise to be caught by the main run loop
         except Exception as e:
-            self.log_signal.emit(f"❌ Single-thread download failed: {str(e)}")
+            self._log(f"❌ Single-thread download failed: {str(e)}")
             raise # Re-raise
 
     def should_pause(self):
-        with QMutexLocker(self._lock):
-            return self._is_paused
+        """Lock-free: a single Event flag read, cheap enough for per-block checks."""
+        return not self._resume_event.is_set()
 
     def _extract_filename(self, soup, fallback_url):
         """
@@ -904,21 +1236,21 @@ class DownloaderWorker(QThread):
         for tag in soup.find_all('meta', attrs={'name': ['title', 'og:title']}):
             if tag.get('content'):
                 title = tag['content']
-                cleaned_title = re.sub(r'[\\/*?:"<>|]', "", title)
+                cleaned_title = INVALID_FS_CHARS_RE.sub("", title)
                 if cleaned_title:
                     return cleaned_title.strip()
         
         # Try <title> tag
         if soup.title and soup.title.string:
             title = soup.title.string
-            cleaned_title = re.sub(r'[\\/*?:"<>|]', "", title)
+            cleaned_title = INVALID_FS_CHARS_RE.sub("", title)
             if cleaned_title:
                 return cleaned_title.strip()
 
         # Fallback to URL basename
         filename_from_url = os.path.basename(fallback_url).split("?")[0].split("#")[0]
         if filename_from_url:
-            cleaned_filename = re.sub(r'[\\/*?:"<>|]', "", filename_from_url)
+            cleaned_filename = INVALID_FS_CHARS_RE.sub("", filename_from_url)
             if cleaned_filename:
                 return cleaned_filename.strip()
 
@@ -933,41 +1265,196 @@ class DownloaderWorker(QThread):
         """
         # 1. Existing window.open logic (common on some redirect pages)
         for script in soup.find_all('script'):
-            if 'function download' in script.text:
-                match = re.search(r'window\.open\(["\'](https?://[^\s"\'\)]+)', script.text)
+            script_text = script.text
+            if 'function download' in script_text:
+                match = WINDOW_OPEN_RE.search(script_text)
                 if match:
                     return match.group(1)
 
-        # 2. Look for direct download links in <a> tags
-        potential_links = []
-        # Look for links with 'download' attribute or specific keywords in href/text
+        # 2. Look for direct download links in <a> tags, keeping the longest
+        # candidate as we go (longer URLs are often more specific)
+        best_href = None
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href']
-            link_text = a_tag.get_text(strip=True).lower()
 
-            # Absolute URL check
-            if not href.startswith(('http://', 'https://')):
+            # Absolute URL check; anything no longer than the current best can't win
+            if not href.startswith(URL_PREFIXES) or (best_href and len(href) <= len(best_href)):
                 continue
-            
-            # Prioritize links with 'download' attribute
-            if a_tag.has_attr('download') or 'download' in link_text or 'get file' in link_text:
-                potential_links.append(href)
-                
-            # Look for common file extensions in the href
-            if any(href.endswith(ext) for ext in ['.zip', '.rar', '.exe', '.iso', '.tar.gz', '.torrent', '.dmg', '.7z', '.gz']):
-                potential_links.append(href)
-        
-        if potential_links:
-            # Simple heuristic: pick the longest URL, often more specific
-            return max(potential_links, key=len)
+
+            # A 'download' attribute or a known file extension qualifies without reading the link text
+            if (a_tag.has_attr('download') or has_download_extension(href)
+                    or any(k in a_tag.get_text(strip=True).lower() for k in ('download', 'get file'))):
+                best_href = href
+
+        if best_href:
+            return best_href
 
         # 3. Fallback: Check if the original link itself is a direct download or can be simplified
-        if any(original_link.lower().endswith(ext) for ext in ['.zip', '.rar', '.exe', '.iso', '.tar.gz', '.torrent', '.dmg', '.7z', '.gz']):
+        if has_download_extension(original_link):
             return original_link
 
         return None # No suitable download URL found
 
 
+# Static widget stylesheets, defined once here instead of inline in the builders
+# "fuckingfast.co" title label in the sidebar and AddLinksDialog
+_TITLE_LABEL_QSS = "font-size: 18px; font-weight: bold; color: #40E0D0; margin-left: 10px;"
+# Sidebar background; cascades to every widget inside the sidebar
+_SIDEBAR_QSS = """
+QWidget {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #23272E, stop:1 #181C22);
+    border-radius: 18px;
+}
+"""
+_SIDEBAR_DESC_QSS = """
+QLabel {
+    color: #B0BEC5;
+    font-size: 14px;
+    font-weight: 300;
+    margin-bottom: 15px;
+}
+"""
+_THEME_COMBO_QSS = """
+QComboBox {
+    border: 2px solid #40E0D0;
+    border-radius: 8px;
+    padding: 8px 12px;
+    background-color: #1A1A1A;
+    color: #E0E0E0;
+    font-size: 12px;
+    font-weight: 500;
+    min-height: 22px;
+}
+QComboBox:hover {
+    border-color: #5DADE2;
+    background-color: #23272E;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 22px;
+}
+QComboBox QAbstractItemView {
+    border: 2px solid #40E0D0;
+    background-color: #23272E;
+    color: #E0E0E0;
+    selection-background-color: #40E0D0;
+    selection-color: #23272E;
+    border-radius: 5px;
+}
+"""
+_SUPPORT_LABEL_QSS = """
+QLabel {
+    font-size: 10px;
+    font-weight: 500;
+    color: #B0BEC5;
+    margin: 8px 3px;
+    line-height: 1.4;
+}
+"""
+_CREDITS_LABEL_QSS = """
+QLabel {
+    font-size: 9px;
+    margin: 4px;
+    padding: 6px;
+    background-color: rgba(64, 224, 208, 0.1);
+    border-radius: 6px;
+    border: 1px solid rgba(64, 224, 208, 0.3);
+}
+"""
+# Rounded section boxes in the sidebar
+_GROUP_QSS = """
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #353B48;
+    border-radius: 15px;
+    margin-top: 1ex;
+    padding-top: 15px;
+    background-color: rgba(38, 43, 51, 0.8);
+    color: #40E0D0;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top center;
+    padding: 0 15px;
+    background-color: #23272E;
+    border-radius: 8px;
+    color: #40E0D0;
+    font-size: 12px;
+    font-weight: bold;
+}
+"""
+# Sidebar GitHub buttons
+_GITHUB_BUTTON_QSS = """
+AnimatedButton {
+    background-color: #333;
+    border: 2px solid #555;
+    color: white;
+    text-align: left;
+    padding: 6px 12px;
+    border-radius: 8px;
+    font-weight: 500;
+    font-size: 11px;
+}
+AnimatedButton:hover {
+    background-color: #555;
+    border-color: #777;
+    transform: translateY(-1px);
+}
+"""
+# AddLinksDialog buttons
+_DIALOG_CANCEL_QSS = """
+AnimatedButton {
+    background-color: #6C7A89;
+    border: 2px solid #5E6977;
+    color: #E0E0E0;
+    padding: 12px 25px;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 12px;
+    min-width: 80px;
+}
+AnimatedButton:hover {
+    background-color: #B0BEC5;
+    color: #23272E;
+}
+"""
+_DIALOG_ADD_QSS = """
+AnimatedButton {
+    background-color: #27AE60;
+    border: 2px solid #1F8B4C;
+    color: white;
+    padding: 12px 25px;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 12px;
+    min-width: 80px;
+}
+AnimatedButton:hover {
+    background-color: #A5D6A7;
+    color: #23272E;
+}
+"""
+_MESSAGE_BOX_QSS = """
+QMessageBox {
+    background-color: #23272E;
+    color: #E0E0E0;
+}
+QMessageBox QPushButton {
+    background-color: #40E0D0;
+    color: #23272E;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+    min-width: 70px;
+}
+QMessageBox QPushButton:hover {
+    background-color: #5DADE2;
+}
+"""
+
+
 class AddLinksDialog(QtWidgets.QDialog):
     """
     Enhanced dialog for adding one or more download links manually with responsive design.
@@ -1027,7 +1514,7 @@ class AddLinksDialog(QtWidgets.QDialog):
             title_layout.addWidget(icon_label)
         
         info_label = QtWidgets.QLabel("Add Download Links")
-        info_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #40E0D0; margin-left: 10px;")
+        info_label.setStyleSheet(_TITLE_LABEL_QSS)
         title_layout.addWidget(info_label)
         title_layout.addStretch()
         layout.addLayout(title_layout)
@@ -1053,42 +1540,12 @@ class AddLinksDialog(QtWidgets.QDialog):
         button_layout.addStretch()
         
         cancel_button = AnimatedButton("Cancel")
-        cancel_button.setStyleSheet("""
-            AnimatedButton {
-                background-color: #6C7A89;
-                border: 2px solid #5E6977;
-                color: #E0E0E0;
-                padding: 12px 25px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            AnimatedButton:hover {
-                background-color: #B0BEC5;
-                color: #23272E;
-            }
-        """)
+        cancel_button.setStyleSheet(_DIALOG_CANCEL_QSS)
         cancel_button.clicked.connect(self.reject)
         button_layout.addWidget(cancel_button)
         
         add_button = AnimatedButton("Add Links")
-        add_button.setStyleSheet("""
-            AnimatedButton {
-                background-color: #27AE60;
-                border: 2px solid #1F8B4C;
-                color: white;
-                padding: 12px 25px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            AnimatedButton:hover {
-                background-color: #A5D6A7;
-                color: #23272E;
-            }
-        """)
+        add_button.setStyleSheet(_DIALOG_ADD_QSS)
         if qta:
             add_button.setIcon(qta.icon('fa5s.plus', color='white'))
         add_button.clicked.connect(self.accept)
@@ -1096,13 +1553,24 @@ class AddLinksDialog(QtWidgets.QDialog):
         
         layout.addLayout(button_layout)
 
+    def clear_input(self):
+        """Empties the paste box so a reused dialog opens blank, with focus ready for pasting."""
+        self.links_input.clear()
+        self.links_input.setFocus()
+
     def get_links(self):
         """
         Returns a list of clean, non-empty links from the QTextEdit.
         """
         links_text = self.links_input.toPlainText()
-        # Split by newline, strip whitespace from each line, and filter out empty lines
-        links = [line.strip() for line in links_text.split('\n') if line.strip() and line.strip().startswith(('http://', 'https://'))]
+        # One pass: strip each line once, keep http(s) links, drop repeats but keep paste order
+        seen = set()
+        links = []
+        for line in links_text.splitlines():
+            link = line.strip()
+            if link.startswith(URL_PREFIXES) and link not in seen:
+                seen.add(link)
+                links.append(link)
         return links
 
     def resizeEvent(self, event):
@@ -1118,111 +1586,37 @@ class AddLinksDialog(QtWidgets.QDialog):
             self.resize(self.width(), max_height)
 
 
-# class MainWindow(ResponsiveWidget):
-#     """
-#     Enhanced main application window for the downloader with responsive design.
-#     """
-#     THEMES = {
-#         "🌙 Dark Blue": "dark_blue.xml",
-#         "☀️ Light Blue": "light_blue.xml", 
-#         "🟠 Dark Amber": "dark_amber.xml",
-#         "🟡 Light Amber": "light_amber.xml",
-#         "🟢 Dark Green": "dark_green.xml",
-#         "🌿 Light Green": "light_green.xml",
-#         "🟣 Dark Purple": "dark_purple.xml",
-#         "🔮 Light Purple": "light_purple.xml",
-#         "🔴 Dark Red": "dark_red.xml",
-#         "🌹 Light Red": "light_red.xml",
-#         "🟦 Dark Teal": "dark_teal.xml",
-#         "💎 Light Teal": "light_teal.xml",
-#         "🌊 Dark Cyan": "dark_cyan.xml",
-#         "🧊 Light Cyan": "light_cyan.xml",
-#         "⚫ Dark Grey": "dark_grey.xml",
-#         "⚪ Light Grey": "light_grey.xml",
-#     }
-
-#     def __init__(self):
-#         super().__init__()
-#         self.setWindowTitle("🚀 Fuckingfast Downloader")
-#         self.setMinimumSize(800, 500)  # Reduced minimum size for better mobile compatibility
-        
-#         # Responsive sizing based on screen
-#         screen = QtWidgets.QApplication.primaryScreen().geometry()
-#         default_width = min(1200, int(screen.width() * 0.8))
-#         default_height = min(800, int(screen.height() * 0.8))
-#         self.resize(default_width, default_height)
-        
-#         self.setStatusBar(QtWidgets.QStatusBar(self))
-#         self.base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
-
-#         # Enhanced icon loading
-#         try:
-#             icon_path = os.path.join(self.base_path, "icons", "logo.ico")
-#             if os.path.exists(icon_path):
-#                 self.setWindowIcon(QtGui.QIcon(icon_path))
-#             else:
-#                 raise FileNotFoundError(f"Icon not found at {icon_path}")
-#         except Exception as e:
-#             if qta:
-#                 self.setWindowIcon(qta.icon('fa5s.rocket', color='#40E0D0'))
-
-#         # Enhanced font setup
-#         font_family = "Segoe UI"
-#         for preferred_font in ["Inter", "SF Pro Display", "Roboto", "Segoe UI"]:
-#             if preferred_font in QFontDatabase().families():
-#                 font_family = preferred_font
-#                 break
-        
-#         default_font = QFont(font_family, 10)
-#         default_font.setStyleHint(QFont.SansSerif)
-#         QtWidgets.QApplication.setFont(default_font)
-
-#         # Initialize UI components
-#         self.init_ui_components()
-        
-#         # Load settings and apply theme
-#         self.load_settings()
-#         apply_stylesheet(self, theme=self.settings.get('theme', 'dark_blue.xml'))
-#         self.apply_enhanced_styles()
-
-#         # Setup main layout
-#         self.setup_main_layout()
-        
-#         # Initialize worker and data
-#         self.worker = None
-#         self.download_queue = []
-#         self.successful_downloads = []
-#         self.failed_downloads = []
-        
-#         # Connect signals
-#         self.connect_signals()
-        
-#         # Initial UI state
-#         self.update_ui_for_idle()
+# Theme combo label -> qt_material stylesheet, shared read-only by every window
+THEMES = MappingProxyType({
+    "🌙 Dark Blue": "dark_blue.xml",
+    "☀️ Light Blue": "light_blue.xml",
+    "🟠 Dark Amber": "dark_amber.xml",
+    "🟡 Light Amber": "light_amber.xml",
+    "🟢 Dark Green": "dark_green.xml",
+    "🌿 Light Green": "light_green.xml",
+    "🟣 Dark Purple": "dark_purple.xml",
+    "🔮 Light Purple": "light_purple.xml",
+    "🔴 Dark Red": "dark_red.xml",
+    "🌹 Light Red": "light_red.xml",
+    "🟦 Dark Teal": "dark_teal.xml",
+    "💎 Light Teal": "light_teal.xml",
+    "🌊 Dark Cyan": "dark_cyan.xml",
+    "🧊 Light Cyan": "light_cyan.xml",
+    "⚫ Dark Grey": "dark_grey.xml",
+    "⚪ Light Grey": "light_grey.xml",
+})
+THEME_NAMES_SORTED = tuple(sorted(THEMES))  # Combo order, computed once at import
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """
     Enhanced main application window for the downloader with responsive design.
     """
 
-    THEMES = {
-        "🌙 Dark Blue": "dark_blue.xml",
-        "☀️ Light Blue": "light_blue.xml",
-        "🟠 Dark Amber": "dark_amber.xml",
-        "🟡 Light Amber": "light_amber.xml",
-        "🟢 Dark Green": "dark_green.xml",
-        "🌿 Light Green": "light_green.xml",
-        "🟣 Dark Purple": "dark_purple.xml",
-        "🔮 Light Purple": "light_purple.xml",
-        "🔴 Dark Red": "dark_red.xml",
-        "🌹 Light Red": "light_red.xml",
-        "🟦 Dark Teal": "dark_teal.xml",
-        "💎 Light Teal": "light_teal.xml",
-        "🌊 Dark Cyan": "dark_cyan.xml",
-        "🧊 Light Cyan": "light_cyan.xml",
-        "⚫ Dark Grey": "dark_grey.xml",
-        "⚪ Light Grey": "light_grey.xml",
-    }
+    THEMES = THEMES
+    THEME_NAMES_SORTED = THEME_NAMES_SORTED
+
+    input_file_signal = pyqtSignal(str) # Outcome of a background input.txt rewrite, logged on the GUI thread
 
     def __init__(self):
         super().__init__()
@@ -1256,12 +1650,21 @@ class MainWindow(QtWidgets.QMainWindow):
             if qta:
                 self.setWindowIcon(qta.icon('fa5s.rocket', color='#40E0D0'))
 
+        # Notification icon, resolved once so qtawesome doesn't re-render per notification
+        self._notif_icon = self.windowIcon()
+        if self._notif_icon.isNull() and qta:
+            self._notif_icon = QtGui.QIcon(qta.icon('fa5s.download', color='#40E0D0').pixmap(QSize(64, 64)))
+        elif self._notif_icon.isNull():
+            self._notif_icon = QtGui.QIcon(":/qt-project.org/qmessagebox/images/information.png")
+        self._tray_icon = None # Created on the first notification, then reused
+
+        # List item brushes, built once instead of parsing color names per signal
+        self._white_brush = QtGui.QBrush(QColor(Qt.white))
+        self._turquoise_brush = QtGui.QBrush(QColor("#40E0D0"))
+        self._red_brush = QtGui.QBrush(QColor("red"))
+
         # Font setup
-        font_family = "Segoe UI"
-        for preferred_font in ["Inter", "SF Pro Display", "Roboto", "Segoe UI"]:
-            if preferred_font in QFontDatabase().families():
-                font_family = preferred_font
-                break
+        font_family = preferred_font_family(("Inter", "SF Pro Display", "Roboto", "Segoe UI"))
 
         default_font = QFont(font_family, 10)
         default_font.setStyleHint(QFont.SansSerif)
@@ -1273,13 +1676,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Load settings + theme
         self.settings = {}
+        self._saved_settings = {}
         try:
             self.load_settings()
         except Exception as e:
             print("Settings load failed:", e)
 
-        apply_stylesheet(self, theme=self.settings.get('theme', 'dark_blue.xml'))
-        self.apply_enhanced_styles()
+        self.apply_theme(self.settings.get('theme', 'dark_blue.xml'))
+        self.apply_enhanced_styles() # Theme-independent, so installed once rather than per theme change
 
         # Setup layout
         self.setup_main_layout()
@@ -1289,6 +1693,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.download_queue = []
         self.successful_downloads = []
         self.failed_downloads = []
+        self._current_total = None # Progress bar maximum currently applied
+        self._current_total_text = "" # Formatted size for _current_total
+        self._processing_link = None # Link currently highlighted by mark_link_processing
+        self._add_dialog = None # AddLinksDialog, created by the first add_links_manually
+        self._restart_pending = False # download_all is waiting for the old worker to finish
+
+        # input.txt rewrites are debounced so a burst of queue edits hits the disk once
+        self._input_save_timer = QtCore.QTimer(self)
+        self._input_save_timer.setSingleShot(True)
+        self._input_save_timer.setInterval(500)
+        self._input_save_timer.timeout.connect(self._write_input_file)
+        # A single I/O thread keeps the rewrites off the event loop and in submission order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="input-writer")
+        self._input_write = None # Future of the most recently submitted rewrite
+        self.input_file_signal.connect(self.log)
 
         # Connect signals
         self.connect_signals()
@@ -1300,33 +1719,60 @@ class MainWindow(QtWidgets.QMainWindow):
         """Initialize all UI components with enhanced styling"""
         
         # Enhanced log area
-        self.log_text = QtWidgets.QTextEdit()
+        # Plain text edit: per-block layout, so appends don't relayout the whole log
+        self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setAcceptRichText(True)
+        self.log_text.setMaximumBlockCount(5000) # Oldest lines drop off instead of growing forever
         self.log_text.setMinimumHeight(150)  # Reduced for mobile
+        self.log_text.setObjectName("activityLog")
+
+        # Families are resolved once here; the stylesheet only sets sizes, so Qt
+        # does not re-match a font-family list on every polish
+        mono_font = QFont(preferred_font_family(("Consolas", "SF Mono", "Monaco", "Menlo"), "monospace"))
+        mono_font.setStyleHint(QFont.Monospace)
+        self.log_text.setFont(mono_font)
+        # Shared by every appended line, so log() doesn't repeat inline styles per message
+        self.log_text.document().setDefaultStyleSheet(
+            "p { font-weight: 500; font-size: 10pt; margin: 2px 0; padding: 2px; }"
+            ".ts { color: #666; font-size: 9pt; }"
+        )
+
+        # Log lines are queued and flushed in one append at most every 100 ms
+        self._log_queue = deque(maxlen=1000)
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_logs)
         
         # Enhanced progress bar
         self.progress_bar = AnimatedProgressBar()
+        self.progress_bar.setObjectName("downloadProgress")
         
         # Enhanced status indicator
         self.status_indicator = StatusIndicator()
         
         # Enhanced buttons with icons
-        self.load_btn = AnimatedButton("📂 Load Links")
-        self.open_downloads_btn = AnimatedButton("📁 Downloads")
-        self.download_btn = AnimatedButton("🚀 Download All")
-        self.pause_btn = AnimatedButton("⏸️ Pause")
-        self.resume_btn = AnimatedButton("▶️ Resume") 
-        self.stop_btn = AnimatedButton("⏹️ Stop All")
-        self.add_links_btn = AnimatedButton("➕ Add Links")
-        self.clear_log_btn = AnimatedButton("🧹 Clear Log")
+        self.load_btn = AnimatedButton("Load Links", emoji="📂")
+        self.open_downloads_btn = AnimatedButton("Downloads", emoji="📁")
+        self.download_btn = AnimatedButton("Download All", emoji="🚀")
+        self.pause_btn = AnimatedButton("Pause", emoji="⏸️")
+        self.resume_btn = AnimatedButton("Resume", emoji="▶️") 
+        self.stop_btn = AnimatedButton("Stop All", emoji="⏹️")
+        self.add_links_btn = AnimatedButton("Add Links", emoji="➕")
+        self.clear_log_btn = AnimatedButton("Clear Log", emoji="🧹")
+        self.add_links_btn.setObjectName("addLinksBtn")
+        self.clear_log_btn.setObjectName("clearLogBtn")
         
         # Enhanced controls
         self.theme_combo = QtWidgets.QComboBox()
         self.theme_combo.setMinimumHeight(35)
         
         # Enhanced list widget
-        self.list_widget = QListWidgetLinks()
+        self.list_widget = QListWidgetLinks(self)
+        self.list_widget.setObjectName("linkList")
+        list_font = QFont(preferred_font_family(("Segoe UI", "Inter"), "sans-serif"))
+        list_font.setStyleHint(QFont.SansSerif)
+        self.list_widget.setFont(list_font)
         
         # Enhanced labels with better typography
         self.link_count_label = QtWidgets.QLabel("📊 Total Links: 0")
@@ -1334,11 +1780,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.progress_detail_label = QtWidgets.QLabel("📈 Downloaded: 0.00 MB | Total: 0.00 MB")
         self.speed_label = QtWidgets.QLabel("⚡ Speed: 0.00 KB/s")
         self.eta_label = QtWidgets.QLabel("⏱️ ETA: N/A")
-        
-        # Social buttons
-        self.github_button = AnimatedButton("🐙 GitHub Aryan")
-        self.github_button = AnimatedButton("🐙 GitHub Yug")
-        self.buymecoffee_button = AnimatedButton("☕ Coffee")
+        self.link_count_label.setObjectName("linkCount")
+        self.file_label.setObjectName("currentFile")
         
         # Info labels
         self.support_label = QtWidgets.QLabel("🎯 Check Out What I've Been Up To!")
@@ -1399,14 +1842,9 @@ class MainWindow(QtWidgets.QMainWindow):
         sidebar_widget.setMaximumWidth(350)
         sidebar_widget.setMinimumWidth(200)
         
-        # Change sidebar background here
-        sidebar_widget.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #23272E, stop:1 #181C22);
-                border-radius: 18px;
-            }
-        """)
+        # Change sidebar background here. This sheet cascades to every sidebar child and
+        # outranks the window-level rules, so sidebar widgets keep their own sheets.
+        sidebar_widget.setStyleSheet(_SIDEBAR_QSS)
         
         sidebar_layout = QtWidgets.QVBoxLayout(sidebar_widget)
         sidebar_layout.setAlignment(Qt.AlignTop)
@@ -1421,20 +1859,13 @@ class MainWindow(QtWidgets.QMainWindow):
             title_layout.addWidget(icon_label)
         
         info_label = QtWidgets.QLabel("fuckingfast.co")
-        info_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #40E0D0; margin-left: 10px;")
+        info_label.setStyleSheet(_TITLE_LABEL_QSS)
         title_layout.addWidget(info_label)
         title_layout.addStretch()
         sidebar_layout.addLayout(title_layout)
 
         desc_label = QtWidgets.QLabel("Downloader")
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: #B0BEC5;
-                font-size: 14px;
-                font-weight: 300;
-                margin-bottom: 15px;
-            }
-        """)
+        desc_label.setStyleSheet(_SIDEBAR_DESC_QSS)
         sidebar_layout.addWidget(desc_label)
 
         # Enhanced grouped controls with responsive button sizing
@@ -1469,27 +1900,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create a styled group of control buttons with responsive sizing"""
         
         group = QtWidgets.QGroupBox(title)
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #353B48;
-                border-radius: 15px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                background-color: rgba(38, 43, 51, 0.8);
-                color: #40E0D0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                background-color: #23272E;
-                border-radius: 8px;
-                color: #40E0D0;
-                font-size: 12px;
-                font-weight: bold;
-            }
-        """)
+        group.setStyleSheet(_GROUP_QSS)
         
         layout = QtWidgets.QVBoxLayout(group)
         layout.setSpacing(8)  # Reduced spacing for mobile
@@ -1505,61 +1916,14 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create enhanced theme selection area with responsive design"""
         
         theme_group = QtWidgets.QGroupBox("🎨 Appearance")
-        theme_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #353B48;
-                border-radius: 15px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                background-color: rgba(38, 43, 51, 0.8);
-                color: #40E0D0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                background-color: #23272E;
-                border-radius: 8px;
-                color: #40E0D0;
-                font-size: 12px;
-                font-weight: bold;
-            }
-        """)
+        theme_group.setStyleSheet(_GROUP_QSS)
         
         layout = QtWidgets.QVBoxLayout(theme_group)
         layout.setSpacing(8)
         layout.setContentsMargins(12, 15, 12, 12)
         
-        self.theme_combo.addItems(sorted(self.THEMES.keys()))
-        self.theme_combo.setStyleSheet("""
-            QComboBox {
-                border: 2px solid #40E0D0;
-                border-radius: 8px;
-                padding: 8px 12px;
-                background-color: #1A1A1A;
-                color: #E0E0E0;
-                font-size: 12px;
-                font-weight: 500;
-                min-height: 22px;
-            }
-            QComboBox:hover {
-                border-color: #5DADE2;
-                background-color: #23272E;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 22px;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #40E0D0;
-                background-color: #23272E;
-                color: #E0E0E0;
-                selection-background-color: #40E0D0;
-                selection-color: #23272E;
-                border-radius: 5px;
-            }
-        """)
+        self.theme_combo.addItems(self.THEME_NAMES_SORTED)
+        self.theme_combo.setStyleSheet(_THEME_COMBO_QSS)
         
         layout.addWidget(self.theme_combo)
         return theme_group
@@ -1575,52 +1939,17 @@ class MainWindow(QtWidgets.QMainWindow):
         social_layout = QtWidgets.QVBoxLayout()
 
         # --- Add two GitHub buttons ---
-        self.github_button_aryan = AnimatedButton("🐙 GitHub Aryan")
+        # clicked(bool) passes checked=False as webbrowser.open's `new`, i.e. its default of 0
+        self.github_button_aryan = AnimatedButton("GitHub Aryan", emoji="🐙")
         self.github_button_aryan.setMinimumHeight(35)
-        self.github_button_aryan.setStyleSheet("""
-            AnimatedButton {
-                background-color: #333;
-                border: 2px solid #555;
-                color: white;
-                text-align: left;
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-weight: 500;
-                font-size: 11px;
-            }
-            AnimatedButton:hover {
-                background-color: #555;
-                border-color: #777;
-                transform: translateY(-1px);
-            }
-        """)
-        self.github_button_aryan.clicked.connect(
-            lambda: webbrowser.open("https://github.com/devbyaryanvala")
-        )
+        self.github_button_aryan.setStyleSheet(_GITHUB_BUTTON_QSS)
+        self.github_button_aryan.clicked.connect(partial(webbrowser.open, "https://github.com/devbyaryanvala"))
         social_layout.addWidget(self.github_button_aryan)
 
-        self.github_button_yug = AnimatedButton("🐙 GitHub Yug")
+        self.github_button_yug = AnimatedButton("GitHub Yug", emoji="🐙")
         self.github_button_yug.setMinimumHeight(35)
-        self.github_button_yug.setStyleSheet("""
-            AnimatedButton {
-                background-color: #333;
-                border: 2px solid #555;
-                color: white;
-                text-align: left;
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-weight: 500;
-                font-size: 11px;
-            }
-            AnimatedButton:hover {
-                background-color: #555;
-                border-color: #777;
-                transform: translateY(-1px);
-            }
-        """)
-        self.github_button_yug.clicked.connect(
-            lambda: webbrowser.open("https://github.com/Yugpatel009")
-        )
+        self.github_button_yug.setStyleSheet(_GITHUB_BUTTON_QSS)
+        self.github_button_yug.clicked.connect(partial(webbrowser.open, "https://github.com/Yugpatel009"))
         social_layout.addWidget(self.github_button_yug)
         # --- End two GitHub buttons ---
 
@@ -1629,15 +1958,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Enhanced support label with responsive text
         self.support_label.setAlignment(Qt.AlignCenter)
         self.support_label.setWordWrap(True)
-        self.support_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                font-weight: 500;
-                color: #B0BEC5;
-                margin: 8px 3px;
-                line-height: 1.4;
-            }
-        """)
+        self.support_label.setStyleSheet(_SUPPORT_LABEL_QSS)
         footer_layout.addWidget(self.support_label)
 
         # Enhanced credits with responsive sizing
@@ -1648,88 +1969,13 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.credits_label.setOpenExternalLinks(True)
         self.credits_label.setAlignment(Qt.AlignCenter)
-        self.credits_label.setStyleSheet("""
-            QLabel {
-                font-size: 9px;
-                margin: 4px;
-                padding: 6px;
-                background-color: rgba(64, 224, 208, 0.1);
-                border-radius: 6px;
-                border: 1px solid rgba(64, 224, 208, 0.3);
-            }
-        """)
+        self.credits_label.setStyleSheet(_CREDITS_LABEL_QSS)
         footer_layout.addWidget(self.credits_label)
 
         return footer_widget
-        """Create enhanced sidebar footer with responsive behavior"""
-        
-        footer_widget = QtWidgets.QWidget()
-        footer_layout = QtWidgets.QVBoxLayout(footer_widget)
-        footer_layout.setSpacing(6)
-        
-        # Social buttons with enhanced styling
-        social_layout = QtWidgets.QVBoxLayout()
-        
-        self.github_button.setMinimumHeight(35)  # Reduced for mobile
-        self.github_button.setStyleSheet("""
-            AnimatedButton {
-                background-color: #333;
-                border: 2px solid #555;
-                color: white;
-                text-align: left;
-                padding: 6px 12px;
-                border-radius: 8px;
-                font-weight: 500;
-                font-size: 11px;
-            }
-            AnimatedButton:hover {
-                background-color: #555;
-                border-color: #777;
-                transform: translateY(-1px);
-            }
-        """)
-        
-        social_layout.addWidget(self.github_button)
-        footer_layout.addLayout(social_layout)
-        
-        # Enhanced support label with responsive text
-        self.support_label.setAlignment(Qt.AlignCenter)
-        self.support_label.setWordWrap(True)
-        self.support_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                font-weight: 500;
-                color: #B0BEC5;
-                margin: 8px 3px;
-                line-height: 1.4;
-            }
-        """)
-        footer_layout.addWidget(self.support_label)
-
-        # Enhanced credits with responsive sizing
-        self.credits_label.setText(
-            "Made with <span style='color: #FF6B6B; font-size: 12px;'>♥</span> by "
-            "<a style='color: #40E0D0; text-decoration: none; font-weight: bold;' href='https://aryanvala.site'>Aryan Vala</a>" "<br> and "
-            "<a style='color: #40E0D0; text-decoration: none; font-weight: bold;' href='#'>Yug K.</a>"
-        )
-        self.credits_label.setOpenExternalLinks(True)
-        self.credits_label.setAlignment(Qt.AlignCenter)
-        self.credits_label.setStyleSheet("""
-            QLabel {
-                font-size: 9px;
-                margin: 4px;
-                padding: 6px;
-                background-color: rgba(64, 224, 208, 0.1);
-                border-radius: 6px;
-                border: 1px solid rgba(64, 224, 208, 0.3);
-            }
-        """)
-        footer_layout.addWidget(self.credits_label)
-        
-        return footer_widget
-
-    def create_content_area(self):
-        """Create the main content area with responsive design"""
+
+    def create_content_area(self):
+        """Create the main content area with responsive design"""
         
         content_widget = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(content_widget)
@@ -1763,27 +2009,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create enhanced link list section with responsive behavior"""
         
         link_group = QtWidgets.QGroupBox("Download Queue")
-        link_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #353B48;
-                border-radius: 15px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                background-color: rgba(38, 43, 51, 0.8);
-                color: #40E0D0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                background-color: #23272E;
-                border-radius: 8px;
-                color: #40E0D0;
-                font-size: 13px;
-                font-weight: bold;
-            }
-        """)
+        link_group.setObjectName("panelGroup")
         
         link_layout = QtWidgets.QVBoxLayout(link_group)
         link_layout.setSpacing(12)
@@ -1793,86 +2019,16 @@ class MainWindow(QtWidgets.QMainWindow):
         header_layout = QtWidgets.QHBoxLayout()
         
         self.add_links_btn.setMinimumHeight(35)  # Reduced for mobile
-        self.add_links_btn.setStyleSheet("""
-            AnimatedButton {
-                background-color: #27AE60;
-                border: 2px solid #1F8B4C;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            AnimatedButton:hover {
-                background-color: #A5D6A7;
-                color: #23272E;
-            }
-        """)
         header_layout.addWidget(self.add_links_btn)
         
         header_layout.addStretch()
         
         self.link_count_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.link_count_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                color: #B0BEC5;
-                font-size: 12px;
-                padding: 6px 10px;
-                background-color: rgba(64, 224, 208, 0.1);
-                border-radius: 8px;
-                border: 1px solid rgba(64, 224, 208, 0.3);
-            }
-        """)
         header_layout.addWidget(self.link_count_label)
         
         link_layout.addLayout(header_layout)
         
-        # Enhanced list widget styling with responsive behavior
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: rgba(26, 26, 26, 0.9);
-                color: #E0E0E0;
-                border: 2px solid #40E0D0;
-                border-radius: 12px;
-                padding: 12px;
-                font-size: 11px;
-                font-family: 'Segoe UI', 'Inter', sans-serif;
-                alternate-background-color: rgba(64, 224, 208, 0.05);
-                selection-background-color: #40E0D0;
-                selection-color: #23272E;
-            }
-            QListWidget::item {
-                padding: 10px;
-                margin: 2px 0;
-                border-radius: 8px;
-                border-left: 3px solid transparent;
-            }
-            QListWidget::item:hover {
-                background-color: rgba(64, 224, 208, 0.15);
-                border-left-color: #40E0D0;
-            }
-            QListWidget::item:selected {
-                background-color: #40E0D0;
-                color: #23272E;
-                border-left-color: #23272E;
-                font-weight: 500;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: rgba(64, 224, 208, 0.1);
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #40E0D0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #5DADE2;
-            }
-        """)
+        # Content-area widgets are styled by object name in apply_enhanced_styles()
         link_layout.addWidget(self.list_widget)
         
         return link_group
@@ -1881,64 +2037,16 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create enhanced download progress section with responsive design"""
         
         download_group = QtWidgets.QGroupBox("Current Download")
-        download_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #353B48;
-                border-radius: 15px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                background-color: rgba(38, 43, 51, 0.8);
-                color: #40E0D0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                background-color: #23272E;
-                border-radius: 8px;
-                color: #40E0D0;
-                font-size: 13px;
-                font-weight: bold;
-            }
-        """)
+        download_group.setObjectName("panelGroup")
         
         download_layout = QtWidgets.QVBoxLayout(download_group)
         download_layout.setSpacing(12)
         download_layout.setContentsMargins(15, 20, 15, 15)
 
         # File info with responsive text
-        self.file_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 12px;
-                color: #40E0D0;
-                padding: 8px;
-                background-color: rgba(64, 224, 208, 0.1);
-                border-radius: 8px;
-                border-left: 4px solid #40E0D0;
-            }
-        """)
         download_layout.addWidget(self.file_label)
 
-        # Progress bar with responsive styling
-        self.progress_bar.setStyleSheet("""
-            AnimatedProgressBar {
-                border: 2px solid #353B48;
-                border-radius: 10px;
-                text-align: center;
-                color: #FFFFFF;
-                background-color: rgba(26, 26, 26, 0.9);
-                font-weight: bold;
-                font-size: 12px;
-                min-height: 28px;
-            }
-            AnimatedProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #40E0D0, stop:0.5 #5DADE2, stop:1 #40E0D0);
-                border-radius: 8px;
-            }
-        """)
+        # Progress bar
         download_layout.addWidget(self.progress_bar)
 
         # Status indicator
@@ -1956,17 +2064,7 @@ class MainWindow(QtWidgets.QMainWindow):
         ]
 
         for label, *pos in info_labels:
-            label.setStyleSheet("""
-                QLabel {
-                    font-weight: 500;
-                    color: #C0C0C0;
-                    font-size: 11px;
-                    padding: 6px 10px;
-                    background-color: rgba(53, 59, 72, 0.5);
-                    border-radius: 6px;
-                    border: 1px solid rgba(64,  224, 208, 0.2);
-                }
-            """)
+            label.setProperty("role", "infoChip") # Styled by QLabel[role="infoChip"] in apply_enhanced_styles()
             label.setAlignment(Qt.AlignCenter)
             info_layout.addWidget(label, *pos)
 
@@ -1977,80 +2075,17 @@ class MainWindow(QtWidgets.QMainWindow):
         """Create enhanced log section with responsive design"""
         
         log_group = QtWidgets.QGroupBox("Activity Log")
-        log_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #353B48;
-                border-radius: 15px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                background-color: rgba(38, 43, 51, 0.8);
-                color: #40E0D0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 15px;
-                background-color: #23272E;
-                border-radius: 8px;
-                               color: #40E0D0;
-                font-size: 13px;
-                font-weight: bold;
-            }
-        """)
+        log_group.setObjectName("panelGroup")
         
         log_layout = QtWidgets.QVBoxLayout(log_group)
         log_layout.setSpacing(8)
         log_layout.setContentsMargins(15, 20, 15, 15)
 
-        # Log text area with enhanced responsive styling
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(24, 28, 34, 0.95);
-                color: #C0C0C0;
-                border: 2px solid #40E0D0;
-                border-radius: 10px;
-                padding: 12px;
-                font-size: 10px;
-                font-family: 'Consolas', 'SF Mono', 'Monaco', 'Menlo', monospace;
-                line-height: 1.4;
-                selection-background-color: #40E0D0;
-                selection-color: #23272E;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: rgba(64, 224, 208, 0.1);
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #40E0D0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #5DADE2;
-            }
-        """)
+        # Log text area
         log_layout.addWidget(self.log_text)
 
         # Clear button with responsive sizing
         self.clear_log_btn.setMinimumHeight(30)
-        self.clear_log_btn.setStyleSheet("""
-            AnimatedButton {
-                background-color: #6C7A89;
-                border: 2px solid #5E6977;
-                color: #E0E0E0;
-                padding: 6px 14px;
-                border-radius: 8px;
-                font-weight: 500;
-                font-size: 10px;
-            }
-            AnimatedButton:hover {
-                background-color: #B0BEC5;
-                color: #23272E;
-            }
-        """)
         log_layout.addWidget(self.clear_log_btn)
         
         return log_group
@@ -2144,7 +2179,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 border-radius: 10px;
                 padding: 12px;
                 font-size: 11px;
-                font-family: 'Consolas', 'SF Mono', 'Monaco', 'Menlo', monospace;
             }
             QScrollBar:vertical {
                 border: none;
@@ -2167,6 +2201,132 @@ class MainWindow(QtWidgets.QMainWindow):
                 font-size: 11px;
                 padding: 3px;
             }
+            /* Content area widgets, matched by object name; ID selectors outrank the rules above */
+            QGroupBox#panelGroup {
+                font-weight: bold;
+                border: 2px solid #353B48;
+                border-radius: 15px;
+                margin-top: 1ex;
+                padding-top: 15px;
+                background-color: rgba(38, 43, 51, 0.8);
+                color: #40E0D0;
+            }
+            QGroupBox#panelGroup::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top center;
+                padding: 0 15px;
+                background-color: #23272E;
+                border-radius: 8px;
+                color: #40E0D0;
+                font-size: 13px;
+                font-weight: bold;
+            }
+            AnimatedButton#addLinksBtn {
+                background-color: #27AE60;
+                border: 2px solid #1F8B4C;
+                color: white;
+                padding: 8px 16px;
+                border-radius: 8px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            AnimatedButton#addLinksBtn:hover {
+                background-color: #A5D6A7;
+                color: #23272E;
+            }
+            QLabel#linkCount {
+                font-weight: bold;
+                color: #B0BEC5;
+                font-size: 12px;
+                padding: 6px 10px;
+                background-color: rgba(64, 224, 208, 0.1);
+                border-radius: 8px;
+                border: 1px solid rgba(64, 224, 208, 0.3);
+            }
+            QListWidget#linkList {
+                background-color: rgba(26, 26, 26, 0.9);
+                color: #E0E0E0;
+                border: 2px solid #40E0D0;
+                border-radius: 12px;
+                padding: 12px;
+                font-size: 11px;
+                alternate-background-color: rgba(64, 224, 208, 0.05);
+                selection-background-color: #40E0D0;
+                selection-color: #23272E;
+            }
+            QListWidget#linkList::item {
+                padding: 10px;
+                margin: 2px 0;
+                border-radius: 8px;
+                border-left: 3px solid transparent;
+            }
+            QListWidget#linkList::item:hover {
+                background-color: rgba(64, 224, 208, 0.15);
+                border-left-color: #40E0D0;
+            }
+            QListWidget#linkList::item:selected {
+                background-color: #40E0D0;
+                color: #23272E;
+                border-left-color: #23272E;
+                font-weight: 500;
+            }
+            QLabel#currentFile {
+                font-weight: bold;
+                font-size: 12px;
+                color: #40E0D0;
+                padding: 8px;
+                background-color: rgba(64, 224, 208, 0.1);
+                border-radius: 8px;
+                border-left: 4px solid #40E0D0;
+            }
+            AnimatedProgressBar#downloadProgress {
+                border: 2px solid #353B48;
+                border-radius: 10px;
+                text-align: center;
+                color: #FFFFFF;
+                background-color: rgba(26, 26, 26, 0.9);
+                font-weight: bold;
+                font-size: 12px;
+                min-height: 28px;
+            }
+            AnimatedProgressBar#downloadProgress::chunk {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #40E0D0, stop:0.5 #5DADE2, stop:1 #40E0D0);
+                border-radius: 8px;
+            }
+            QPlainTextEdit#activityLog {
+                background-color: rgba(24, 28, 34, 0.95);
+                color: #C0C0C0;
+                border: 2px solid #40E0D0;
+                border-radius: 10px;
+                padding: 12px;
+                font-size: 10px;
+                line-height: 1.4;
+                selection-background-color: #40E0D0;
+                selection-color: #23272E;
+            }
+            AnimatedButton#clearLogBtn {
+                background-color: #6C7A89;
+                border: 2px solid #5E6977;
+                color: #E0E0E0;
+                padding: 6px 14px;
+                border-radius: 8px;
+                font-weight: 500;
+                font-size: 10px;
+            }
+            AnimatedButton#clearLogBtn:hover {
+                background-color: #B0BEC5;
+                color: #23272E;
+            }
+            QLabel[role="infoChip"] {
+                font-weight: 500;
+                color: #C0C0C0;
+                font-size: 11px;
+                padding: 6px 10px;
+                background-color: rgba(53, 59, 72, 0.5);
+                border-radius: 6px;
+                border: 1px solid rgba(64, 224, 208, 0.2);
+            }
         """)
 
     def resizeEvent(self, event: QtGui.QResizeEvent):
@@ -2177,48 +2337,42 @@ class MainWindow(QtWidgets.QMainWindow):
         self.current_width = self.width()
         self.current_height = self.height()
 
-        # Update button text based on window width for ultra-compact mode
-        if hasattr(self, 'download_btn'):
-            if self.current_width < 600:
-                self.download_btn.setText("🚀 Download")
-                self.add_links_btn.setText("➕ Add")
-                self.open_downloads_btn.setText("📁 Files")
+        # Update button text based on window width for ultra-compact mode,
+        # only when the width crosses the threshold rather than on every resize step
+        short_labels = self.current_width < 600
+        if hasattr(self, 'download_btn') and short_labels != getattr(self, '_short_labels', None):
+            self._short_labels = short_labels
+            if short_labels:
+                self.download_btn.setText("Download")
+                self.add_links_btn.setText("Add")
+                self.open_downloads_btn.setText("Files")
             else:
-                self.download_btn.setText("🚀 Download All")
-                self.add_links_btn.setText("➕ Add Links")
-                self.open_downloads_btn.setText("📁 Downloads")
+                self.download_btn.setText("Download All")
+                self.add_links_btn.setText("Add Links")
+                self.open_downloads_btn.setText("Downloads")
+
+    # (widget attribute, signal, slot path on the window) wired up by connect_signals
+    _SIGNAL_WIRING = (
+        ("load_btn", "clicked", "load_links"),
+        ("download_btn", "clicked", "download_all"),
+        ("pause_btn", "clicked", "pause_download"),
+        ("resume_btn", "clicked", "resume_download"),
+        ("stop_btn", "clicked", "stop_download"),
+        ("open_downloads_btn", "clicked", "open_downloads_folder"),
+        ("add_links_btn", "clicked", "add_links_manually"),
+        ("clear_log_btn", "clicked", "log_text.clear"),
+        ("theme_combo", "currentIndexChanged", "change_theme"),
+        ("list_widget", "itemDoubleClicked", "copy_link_to_clipboard"),
+    )
 
     def connect_signals(self):
         """Connect all UI signals"""
         try:
-            if hasattr(self, "load_btn"):
-                self.load_btn.clicked.connect(self.load_links)
-            if hasattr(self, "download_btn"):
-                self.download_btn.clicked.connect(self.download_all)
-            if hasattr(self, "pause_btn"):
-                self.pause_btn.clicked.connect(self.pause_download)
-            if hasattr(self, "resume_btn"):
-                self.resume_btn.clicked.connect(self.resume_download)
-            if hasattr(self, "stop_btn"):
-                self.stop_btn.clicked.connect(self.stop_download)
-            if hasattr(self, "open_downloads_btn"):
-                self.open_downloads_btn.clicked.connect(self.open_downloads_folder)
-            if hasattr(self, "add_links_btn"):
-                self.add_links_btn.clicked.connect(self.add_links_manually)
-            if hasattr(self, "clear_log_btn") and hasattr(self, "log_text"):
-                self.clear_log_btn.clicked.connect(self.log_text.clear)
-            if hasattr(self, "theme_combo"):
-                self.theme_combo.currentIndexChanged.connect(self.change_theme)
-            if hasattr(self, "github_button"):
-                self.github_button.clicked.connect(
-                    lambda: webbrowser.open("https://github.com/devbyaryanvala")
-                )
-            if hasattr(self, "github_button"):
-                self.github_button.clicked.connect(
-                    lambda: webbrowser.open("https://github.com/Yugpatel009")
-                )
+            for attr, signal, slot in self._SIGNAL_WIRING:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    getattr(widget, signal).connect(attrgetter(slot)(self))
             if hasattr(self, "list_widget"):
-                self.list_widget.itemDoubleClicked.connect(self.copy_link_to_clipboard)
                 self.list_widget.model().rowsMoved.connect(self.update_link_numbers)
 
         except Exception as e:
@@ -2229,93 +2383,124 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings = {}
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    self.settings = json.load(f)
-            except json.JSONDecodeError as e:
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+                self.settings = orjson.loads(data) if orjson else json.loads(data)
+            except ValueError as e: # JSONDecodeError (orjson's subclasses it) or undecodable bytes
                 print(f"Error reading config file: {e}. Using default settings.")
+        self._saved_settings = copy.deepcopy(self.settings) # What's on disk, to skip no-op saves
         
     def save_settings(self):
-        """Saves current application settings to a JSON file."""
+        """Saves current application settings to a JSON file if they changed."""
+        if self.settings == self._saved_settings:
+            return
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            if orjson:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.settings, indent=2).encode() # Same layout as orjson's OPT_INDENT_2
+            # QSaveFile writes a temp file and renames it over the config on commit(),
+            # so a crash mid-write leaves the previous config intact instead of an empty one
+            config = QtCore.QSaveFile(CONFIG_FILE)
+            if not (config.open(QtCore.QIODevice.WriteOnly) and config.write(data) == len(data) and config.commit()):
+                raise OSError(config.errorString())
+            self._saved_settings = copy.deepcopy(self.settings)
         except Exception as e:
             self.log(f"Error saving config file: {e}")
 
+    def remember_chunk_workers(self, host, workers):
+        """Keeps the chunk concurrency the worker settled on for a host; saved with the other settings."""
+        self.settings.setdefault('chunk_workers', {})[host] = workers
+
     def change_theme(self, index):
         theme_name = self.theme_combo.currentText()
         theme_file = self.THEMES.get(theme_name, "dark_blue.xml")
-        apply_stylesheet(self, theme=theme_file)
+        self.apply_theme(theme_file)
         self.settings['theme'] = theme_file
         self.save_settings()
         self.log(f"Theme changed to '{theme_name}'.")
-        self.apply_enhanced_styles()
 
-    def update_ui_for_idle(self):
-        self.download_btn.setEnabled(True)
-        self.load_btn.setEnabled(True)
-        self.pause_btn.setEnabled(False)
-        self.resume_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
-        self.add_links_btn.setEnabled(True)
-        
+    def apply_theme(self, theme_file):
+        """
+        Apply a qt_material theme without repolishing the window.
+        The window's sheet is apply_enhanced_styles()' alone and does not vary by theme, so it
+        is installed once in __init__; build_stylesheet() only runs for the palette, fonts and
+        icon resources it sets up, which Qt propagates to existing widgets by itself.
+        """
+        build_stylesheet(theme=theme_file)
+
+    # Enabled flags per UI state, in _STATE_BUTTONS order
+    _STATE_BUTTONS = ("download_btn", "load_btn", "pause_btn", "resume_btn", "stop_btn", "add_links_btn")
+    _BUTTON_STATES = MappingProxyType({
+        "idle":        (True,  True,  False, False, False, True),
+        "downloading": (False, False, True,  False, True,  False),
+        "paused":      (False, False, False, True,  True,  False),
+    })
+
+    def _apply_button_state(self, state):
+        """Set every control button's enabled flag for a UI state in one loop."""
+        for name, enabled in zip(self._STATE_BUTTONS, self._BUTTON_STATES[state]):
+            getattr(self, name).setEnabled(enabled)
+
+    def _reset_progress_display(self, progress_format):
+        """Put the progress bar and the file/detail/speed/ETA labels back to their empty values."""
         self.progress_bar.setValue(0)
-        self.progress_bar.setFormat("Ready")
+        self.progress_bar.setFormat(progress_format)
         self.file_label.setText("Current File: None")
         self.progress_detail_label.setText("Downloaded: 0.00 MB | Total: 0.00 MB")
         self.speed_label.setText("Speed: 0.00 KB/s")
         self.eta_label.setText("ETA: N/A")
+
+    def update_ui_for_idle(self):
+        self._apply_button_state("idle")
+        self._reset_progress_display("Ready")
         self.status_indicator.set_status("Ready", "green")
         self.update_link_numbers()
 
     def update_ui_for_downloading(self):
-        self.download_btn.setEnabled(False)
-        self.load_btn.setEnabled(False)
-        self.pause_btn.setEnabled(True)
-        self.resume_btn.setEnabled(False)  
-        self.stop_btn.setEnabled(True)
-        self.add_links_btn.setEnabled(False)
+        self._apply_button_state("downloading")
 
     def update_ui_for_paused(self):
-        self.pause_btn.setEnabled(False)
-        self.resume_btn.setEnabled(True)
-        self.stop_btn.setEnabled(True)
+        self._apply_button_state("paused")
 
     def update_ui_for_resumed(self):
-        self.pause_btn.setEnabled(True)
-        self.resume_btn.setEnabled(False)
-        self.stop_btn.setEnabled(True)
+        self._apply_button_state("downloading")
 
     # Rest of the methods remain the same as in the original code...
     # (load_links, add_links_manually, copy_link_to_clipboard, log, download_all, 
     #  pause_download, resume_download, stop_download, open_downloads_folder,
-    #  update_progress, update_speed, update_file, update_status, mark_link_processing,
+    #  update_progress, update_file, update_status, mark_link_processing,
     #  update_link_numbers, handle_link_completed, handle_link_failed, 
     #  handle_session_finished, remove_selected_links, clear_all_links,
     #  _update_input_file, show_notification, closeEvent)
 
     def load_links(self):
+        self._flush_input_file() # Otherwise a pending rewrite would be read stale, then land over the reload
         if not os.path.exists(INPUT_FILE):
             with open(INPUT_FILE, 'w') as f:
                 f.write("# Add download links here (lines starting with # are comments)\n")
             QtWidgets.QMessageBox.information(self, "Info", f"Input file '{INPUT_FILE}' not found. It has been created. Please add links and reload.")
             return
 
-        self.list_widget.clear()
-        self.download_queue.clear()
-        with open(INPUT_FILE, 'r') as f:
-            for line in f:
-                stripped_line = line.strip()
-                if stripped_line and not stripped_line.startswith("#"):
-                    self.list_widget.addItem(stripped_line)
-                    self.download_queue.append(stripped_line)
+        with open(INPUT_FILE, 'r', encoding='utf-8', errors='replace') as f:
+            # Read and split in C, then keep the non-blank, non-comment lines in one comprehension
+            links = [line for line in map(str.strip, f.read().splitlines()) if line and not line.startswith("#")]
+
+        self.download_queue = links
+        with frozen(self.list_widget): # One repaint for the whole file
+            self.list_widget.clear()
+            for link in links:
+                self.list_widget.add_link(link)
         self.log(f"Loaded {len(self.download_queue)} link(s) from {INPUT_FILE}")
-        self.update_link_numbers()
-        self.update_ui_for_idle()
+        self.update_ui_for_idle() # Also renumbers the list and refreshes the count
 
     def add_links_manually(self):
         """Opens a dialog to add one or more links manually."""
-        dialog = AddLinksDialog(self)
+        # Built on first use and kept: parented dialogs were never freed, and reopening skips the layout/QSS work
+        if self._add_dialog is None:
+            self._add_dialog = AddLinksDialog(self)
+        dialog = self._add_dialog
+        dialog.clear_input()
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             links = dialog.get_links()
             if not links:
@@ -2323,69 +2508,96 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             added_count = 0
-            for link in links:
-                if link not in self.download_queue:
-                    self.list_widget.addItem(link)
-                    self.download_queue.append(link)
-                    added_count += 1
-                else:
-                    self.log(f"Link already in queue (skipped): {link[:60]}...")
+            with frozen(self.list_widget): # One repaint for the whole paste
+                for link in links:
+                    if not self.list_widget.has_link(link): # O(1): the list indexes every queued URL
+                        self.list_widget.add_link(link)
+                        self.download_queue.append(link)
+                        added_count += 1
+                    else:
+                        self.log(f"Link already in queue (skipped): {link[:60]}...")
 
             if added_count > 0:
-                self.update_link_numbers()
+                # Appended to both the list and the queue above, so there is nothing to renumber or resync
+                self.link_count_label.setText(f"Total Links: {self.list_widget.count()}")
                 self._update_input_file()
                 self.log(f"Added {added_count} new link(s).")
             else:
                 self.statusBar().showMessage("No new links were added (all were duplicates).", 3000)
 
+    def _url(self, item):
+        """Return the raw URL stored on a list item."""
+        return item.data(Qt.UserRole)
+
     def copy_link_to_clipboard(self, item):
-        link = item.text().split(". ", 1)[-1] if ". " in item.text() else item.text()
+        link = self._url(item)
         QtWidgets.QApplication.clipboard().setText(link)
         self.statusBar().showMessage("Link copied to clipboard", 2000)
 
     def log(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        colored_message = colorize_log_message(message)
+        timestamp = time.strftime("%H:%M:%S")
         if hasattr(self, 'log_text'):
-            self.log_text.append(f"<p style='font-weight:500; font-family: \"Consolas\", monospace; font-size:10pt; margin:2px 0; padding:2px;'><span style='color:#666; font-size:9pt;'>[{timestamp}]</span> {colored_message}</p>")
-            self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
+            # Line and timestamp styling come from the document's default stylesheet
+            self._log_queue.append(f"<p><span class='ts'>[{timestamp}]</span> {colorize_log_message(message)}</p>")
+            if not self._log_timer.isActive():
+                self._log_timer.start()
         else:
             print(f"[{timestamp}] {message}")
 
+    def _drain_worker_logs(self):
+        for message in self.sender().drain_logs(): # sender(): a stopped worker may still be draining
+            self.log(message)
+
+    def _flush_logs(self):
+        """Append all queued log lines in a single layout pass."""
+        if not self._log_queue:
+            return
+        self.log_text.appendHtml("".join(self._log_queue))
+        self._log_queue.clear()
+        self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
+
     def download_all(self):
         if self.worker and self.worker.isRunning():
-            self.log("Stopping current download session before starting new one...")
-            self.worker.stop()
-            self.worker.wait(3000)
+            # Don't block the GUI thread in wait(): start again once the old worker's thread has finished
+            if not self._restart_pending:
+                self._restart_pending = True
+                self.log("Stopping current download session before starting new one...")
+                self.worker.finished.connect(self._restart_download)
+                self.worker.request_stop()
+                if self.worker.isFinished(): # Thread ended before the connect: finished will not fire again
+                    self._restart_download()
+            return
 
         if not self.download_queue:
             QtWidgets.QMessageBox.information(self, "Info", "No links to download. Please load links first.")
             return
         
-        self.progress_bar.setValue(0)
-        self.progress_bar.setFormat("Starting...")
-        self.file_label.setText("Current File: None")
-        self.progress_detail_label.setText("Downloaded: 0.00 MB | Total: 0.00 MB")
-        self.speed_label.setText("Speed: 0.00 KB/s")
-        self.eta_label.setText("ETA: N/A")
+        self._reset_progress_display("Starting...")
         self.successful_downloads = []
         self.failed_downloads = []
 
-        self.worker = DownloaderWorker(self.download_queue[:])
-        self.worker.log_signal.connect(self.log)
+        self._restart_pending = False # A fresh session is starting; no restart is owed any more
+        self.worker = DownloaderWorker(self.download_queue[:], self.settings.get('chunk_workers'))
+        self.worker.log_ready_signal.connect(self._drain_worker_logs)
         self.worker.progress_signal.connect(self.update_progress)
         self.worker.file_signal.connect(self.update_file)
         self.worker.status_signal.connect(self.update_status)
-        self.worker.speed_signal.connect(self.update_speed)
         self.worker.link_completed_signal.connect(self.handle_link_completed)
         self.worker.link_failed_signal.connect(self.handle_link_failed)
         self.worker.session_finished_signal.connect(self.handle_session_finished)
         self.worker.link_processing_signal.connect(self.mark_link_processing)
+        self.worker.chunk_workers_tuned_signal.connect(self.remember_chunk_workers)
         
         self.worker.start()
         self.update_ui_for_downloading()
         self.log("Download session initiated.")
 
+    def _restart_download(self):
+        """Starts the session download_all deferred until the previous worker stopped."""
+        if self._restart_pending: # Cleared if the user stopped or closed in the meantime
+            self._restart_pending = False
+            self.download_all()
+
     def pause_download(self):
         if self.worker and self.worker.isRunning():
             self.worker.pause()
@@ -2399,6 +2611,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.status_indicator.set_status("Downloading...", "blue")
 
     def stop_download(self):
+        self._restart_pending = False # An explicit stop also cancels a queued restart
         if self.worker and self.worker.isRunning():
             self.log("Requesting worker to stop...")
             self.worker.stop()
@@ -2410,114 +2623,100 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def open_downloads_folder(self):
         """Opens the downloads folder using the OS default file manager."""
-        if not os.path.exists(DOWNLOADS_FOLDER):
-            os.makedirs(DOWNLOADS_FOLDER)
-        QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.abspath(DOWNLOADS_FOLDER)))
-        self.log(f"Opened downloads folder: {os.path.abspath(DOWNLOADS_FOLDER)}")
-
-    def update_progress(self, downloaded, total):
-        self.progress_bar.setMaximum(total)
+        os.makedirs(_ABS_DOWNLOADS, exist_ok=True)  # Recreate if deleted while running
+        QDesktopServices.openUrl(_DOWNLOADS_URL)
+        self.log(f"Opened downloads folder: {_ABS_DOWNLOADS}")
+
+    def update_progress(self, downloaded, total, current_speed_bps, overall_speed_bps, eta_seconds):
+        """Apply one worker tick to the progress bar and the detail/speed/ETA labels in a single slot."""
+        # The total only changes between files; avoid a relayout on every tick
+        if total != self._current_total:
+            self.progress_bar.setMaximum(total)
+            self._current_total = total
+            self._current_total_text = self.worker._format_bytes(total)
         self.progress_bar.setValue(downloaded)
+        downloaded_text = self.worker._format_bytes(downloaded) # Formatted once per tick for both labels
         
         if total > 0:
             percent = (downloaded * 100 / total)
-            self.progress_bar.setFormat(f"{percent:.1f}% - {self.worker._format_bytes(downloaded)} / {self.worker._format_bytes(total)}")
+            self.progress_bar.setFormat(f"{percent:.1f}% - {downloaded_text} / {self._current_total_text}")
         else:
             self.progress_bar.setFormat("0%")
 
         self.progress_detail_label.setText(
-            f"Downloaded: {self.worker._format_bytes(downloaded)} | "
-            f"Total: {self.worker._format_bytes(total)}"
+            f"Downloaded: {downloaded_text} | "
+            f"Total: {self._current_total_text}"
         )
-
-    def update_speed(self, current_speed_bps, overall_speed_bps, eta_seconds):
-        """Handle speed updates with proper unit formatting"""
         self.speed_label.setText(f"Speed: {self.worker._format_speed(overall_speed_bps)}")
         self.eta_label.setText(f"ETA: {self.worker._format_eta(eta_seconds)}")
 
     def update_file(self, filename):
         self.file_label.setText(f"Current File: {filename}")
 
+    # Leading word of a worker status -> (indicator prefix, colour)
+    _STATUS_STYLES = MappingProxyType({
+        "Paused": ("⏸", "gold"),
+        "Downloading": ("⬇", "blue"), "Resuming": ("⬇", "blue"), "Fetching": ("⬇", "blue"),
+        "Idle": ("✓", "green"), "Finished": ("✓", "green"), "Completed": ("✓", "green"),
+        "Error": ("✗", "red"), "Failed": ("✗", "red"), "Stopping": ("✗", "red"),
+    })
+
     def update_status(self, status):
-        if "Paused" in status:
-            self.status_indicator.set_status(f"⏸ {status}", "gold")
-        elif "Downloading" in status or "Resuming" in status or "Fetching" in status:
-            self.status_indicator.set_status(f"⬇ {status}", "blue")
-        elif "Idle" in status or "Finished" in status or "Completed" in status:
-            self.status_indicator.set_status(f"✓ {status}", "green")
-        elif "Error" in status or "Failed" in status or "Stopping" in status:
-            self.status_indicator.set_status(f"✗ {status}", "red")
+        # Statuses lead with their state word ("Fetching: ...", "Resuming..."), so one lookup classifies them
+        key = status.split(None, 1)[0].rstrip(":.") if status else ""
+        style = self._STATUS_STYLES.get(key)
+        if style:
+            self.status_indicator.set_status(f"{style[0]} {status}", style[1])
         else:
             self.status_indicator.set_status(status, "green")
 
     def mark_link_processing(self, processing_link):
         """Marks the currently processing link in the QListWidget with a distinctive color."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            current_link_in_list = item.text().split(". ", 1)[-1]
-            if current_link_in_list == processing_link:
-                item.setForeground(QColor("#40E0D0"))
-                item.setToolTip("Currently downloading...")
-            else:
-                if item.foreground().color() != QColor("red"):
-                    item.setForeground(QColor(Qt.white))
-                    item.setToolTip("")
+        # Only the previously highlighted link needs resetting; looked up by URL since it may have been removed
+        previous = self.list_widget.item_for(self._processing_link)
+        if previous is not None and previous.data(LINK_STATUS_ROLE) == LINK_PROCESSING:
+            previous.setForeground(self._white_brush)
+            previous.setToolTip("")
+            previous.setData(LINK_STATUS_ROLE, LINK_NORMAL)
+        self._processing_link = processing_link
+
+        item = self.list_widget.item_for(processing_link)
+        if item is not None:
+            item.setForeground(self._turquoise_brush)
+            item.setToolTip("Currently downloading...")
+            item.setData(LINK_STATUS_ROLE, LINK_PROCESSING)
 
     def update_link_numbers(self):
-        """Re-numbers the items in the QListWidget based on their current index and updates total count."""
-        self.list_widget.blockSignals(True)  
-        try:
-            current_links_in_widget = []
-            for i in range(self.list_widget.count()):
-                item = self.list_widget.item(i)
-                original_link = item.text().split(". ", 1)[-1] if ". " in item.text() else item.text()
-                
-                current_color = item.foreground().color() if item.foreground() else QtGui.QColor(Qt.white)
-                current_font = item.font() if item.font() else self.list_widget.font()
-                
-                item.setText(f"{i + 1}. {original_link}")
-                item.setForeground(current_color)
-                item.setFont(current_font)
-                current_links_in_widget.append(original_link)
-            
-            self.download_queue = current_links_in_widget
+        """Syncs the download queue with the list order and updates the total count.
+        The numbers themselves are painted from the row by NumberedItemDelegate."""
+        self.download_queue = [self._url(self.list_widget.item(i)) for i in range(self.list_widget.count())]
+        self.list_widget.viewport().update()
 
-        finally:
-            self.list_widget.blockSignals(False)
-            self.link_count_label.setText(f"Total Links: {self.list_widget.count()}")
+        self.link_count_label.setText(f"Total Links: {self.list_widget.count()}")
 
     def handle_link_completed(self, link_completed):
         """Handles a link that has successfully completed download."""
-        removed_from_list = False
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            current_link_in_list = item.text().split(". ", 1)[-1]  
-            if current_link_in_list == link_completed:
-                self.list_widget.takeItem(i)
-                self.log(f"Removed completed link '{link_completed[:50]}...' from list.")
-                removed_from_list = True
-                break
-        
-        if removed_from_list:
-            self.download_queue = [self.list_widget.item(i).text().split(". ", 1)[-1] for i in range(self.list_widget.count())]
+        item = self.list_widget.item_for(link_completed)
+        if item is not None:
+            self.list_widget.takeItem(self.list_widget.row(item))
+            self.log(f"Removed completed link '{link_completed[:50]}...' from list.")
+            # The queue mirrors the list, so drop the one entry rather than rebuilding it from every row;
+            # the rows below repaint their own numbers as the view shifts them up
+            self.download_queue.remove(link_completed)
+            self.link_count_label.setText(f"Total Links: {self.list_widget.count()}")
             self._update_input_file()
-            self.update_link_numbers()
 
         self.show_notification("Download Completed!", f"Successfully downloaded: {link_completed.split('/')[-1]}")
 
     def handle_link_failed(self, failed_link, error_message):
         """Marks a link in the list widget as failed (red color) and logs the error."""
-        found_in_list = False
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            current_link_in_list = item.text().split(". ", 1)[-1]
-            if current_link_in_list == failed_link:
-                item.setForeground(QColor("red"))
-                item.setToolTip(f"Failed: {error_message}")
-                self.log(f"Link '{failed_link[:50]}...' failed: {error_message}")
-                found_in_list = True
-                break
-        if not found_in_list:
+        item = self.list_widget.item_for(failed_link)
+        if item is not None:
+            item.setForeground(self._red_brush)
+            item.setToolTip(f"Failed: {error_message}")
+            item.setData(LINK_STATUS_ROLE, LINK_FAILED)
+            self.log(f"Link '{failed_link[:50]}...' failed: {error_message}")
+        else:
             self.log(f"Failed link '{failed_link[:50]}...' not found in list (might have been removed). Error: {error_message}")
 
         self.status_indicator.set_status("Error: Check Log", "red")
@@ -2525,42 +2724,43 @@ class MainWindow(QtWidgets.QMainWindow):
     def handle_session_finished(self, completed_links, failed_links):
         """Called when the DownloaderWorker finishes its entire session."""
         self.log(f"Download session finished. {len(completed_links)} completed, {len(failed_links)} failed.")
+        if self._restart_pending:
+            return # Stopped for a restart: the next session takes over the UI, no idle reset or summary
         self.update_ui_for_idle()
 
-        summary_msg = (
+        parts = [
             f"Download Session Completed!\n\n"
             f"Successfully Downloaded: {len(completed_links)} file(s)\n"
             f"Failed Downloads: {len(failed_links)} file(s)"
-        )
+        ]
         if failed_links:
-            summary_msg += "\n\nFailed links (check log for details):\n"
-            for link in failed_links[:5]:
-                summary_msg += f"- {link[:70]}...\n"
+            parts.append("\nFailed links (check log for details):")
+            parts.extend(f"- {link[:70]}..." for link in failed_links[:5])
             if len(failed_links) > 5:
-                summary_msg += f"... and {len(failed_links) - 5} more."
-        
+                parts.append(f"... and {len(failed_links) - 5} more.")
+        summary_msg = "\n".join(parts)
+
         QtWidgets.QMessageBox.information(self, "Download Summary", summary_msg)
 
     def remove_selected_links(self):
         """Removes selected links from the list widget and input.txt."""
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        # Rows straight from the selection model; QListWidget.row(item) is a linear search per item
+        selected_rows = sorted((index.row() for index in self.list_widget.selectedIndexes()), reverse=True)
+        if not selected_rows:
             QtWidgets.QMessageBox.information(self, "Info", "No links selected to remove.")
             return
 
         reply = QtWidgets.QMessageBox.question(self, 'Remove Links', 
-                                            f"Are you sure you want to remove {len(selected_items)} selected link(s)?", 
+                                            f"Are you sure you want to remove {len(selected_rows)} selected link(s)?", 
                                             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
-            for item in reversed(selected_items):
-                row = self.list_widget.row(item)
-                link_to_remove = item.text().split(". ", 1)[-1]
-                self.list_widget.takeItem(row)
-                self.log(f"Removed '{link_to_remove[:50]}...' from list.")
+            with frozen(self.list_widget):
+                for row in selected_rows: # Bottom-up, so the remaining rows keep their indexes
+                    link_to_remove = self._url(self.list_widget.takeItem(row))
+                    self.log(f"Removed '{link_to_remove[:50]}...' from list.")
 
-            self.download_queue = [self.list_widget.item(i).text().split(". ", 1)[-1] for i in range(self.list_widget.count())]
-            self._update_input_file()
-            self.update_link_numbers()
+                self.update_link_numbers() # Also resyncs download_queue for the file rewrite
+                self._update_input_file()
 
     def clear_all_links(self):
         """Clears all links from the list widget and input.txt."""
@@ -2572,37 +2772,53 @@ class MainWindow(QtWidgets.QMainWindow):
                                             "Are you sure you want to clear ALL links from the list and input.txt?", 
                                             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
-            self.list_widget.clear()
+            with frozen(self.list_widget):
+                self.list_widget.clear()
             self.download_queue.clear()
             self._update_input_file()
             self.log("All links cleared from list and input.txt.")
             self.update_ui_for_idle()
 
     def _update_input_file(self):
-        """Rewrites the input.txt file with the current links in the download queue."""
+        """Schedules a rewrite of input.txt; changes within 500 ms of each other are written together."""
+        self._input_save_timer.start()
+
+    def _write_input_file(self):
+        """Snapshots the download queue and hands the input.txt rewrite to the I/O thread."""
+        self._input_save_timer.stop()
+        # One joined string instead of a Python-level write per link
+        lines = ["# Add download links here (lines starting with # are comments)", *self.download_queue, ""]
+        self._input_write = self._io_executor.submit(self._replace_input_file, "\n".join(lines))
+
+    def _flush_input_file(self):
+        """Writes any debounced queue change now and waits until input.txt on disk matches the queue."""
+        if self._input_save_timer.isActive():
+            self._write_input_file()
+        if self._input_write is not None:
+            self._input_write.result() # Single-worker executor: the latest write finishing means all have
+
+    def _replace_input_file(self, text):
+        """Runs on the I/O thread; reports back through input_file_signal since it can't touch widgets."""
         try:
-            with open(INPUT_FILE, 'w') as f:
-                f.write("# Add download links here (lines starting with # are comments)\n")
-                for link in self.download_queue:
-                    f.write(link + "\n")
-            self.log(f"{INPUT_FILE} updated successfully.")
+            # Same atomic temp-file-and-rename as save_settings, so a crash never leaves a half-written queue
+            queue_file = QtCore.QSaveFile(INPUT_FILE)
+            data = text.encode('utf-8')
+            if not (queue_file.open(QtCore.QIODevice.WriteOnly | QtCore.QIODevice.Text)
+                    and queue_file.write(data) == len(data) and queue_file.commit()):
+                raise OSError(queue_file.errorString())
+            self.input_file_signal.emit(f"{INPUT_FILE} updated successfully.")
         except Exception as e:
-            self.log(f"Error writing to {INPUT_FILE}: {e}")
+            self.input_file_signal.emit(f"Error writing to {INPUT_FILE}: {e}")
 
     def show_notification(self, title, message):
         """Displays a desktop notification with enhanced styling."""
         if QtWidgets.QSystemTrayIcon.isSystemTrayAvailable():
             try:
-                icon = self.windowIcon()
-                if icon.isNull() and qta:
-                    icon = qta.icon('fa5s.download', color='#40E0D0')
-                elif icon.isNull():
-                    icon = QtGui.QIcon(":/qt-project.org/qmessagebox/images/information.png")
-
-                tray_icon = QtWidgets.QSystemTrayIcon(icon, self)
-                tray_icon.show()
-                tray_icon.showMessage(title, message, QtWidgets.QSystemTrayIcon.Information, 5000)
-                QtCore.QTimer.singleShot(6000, tray_icon.deleteLater)
+                # One tray registration for the window's lifetime rather than one per notification
+                if self._tray_icon is None:
+                    self._tray_icon = QtWidgets.QSystemTrayIcon(self._notif_icon, self)
+                    self._tray_icon.show()
+                self._tray_icon.showMessage(title, message, QtWidgets.QSystemTrayIcon.Information, 5000)
             except Exception as e:
                 self.log(f"Error showing tray notification: {e}. Falling back to QMessageBox.")
                 QtWidgets.QMessageBox.information(self, title, message)
@@ -2611,28 +2827,12 @@ class MainWindow(QtWidgets.QMainWindow):
             msg_box = QtWidgets.QMessageBox(self)
             msg_box.setWindowTitle(title)
             msg_box.setText(message)
-            msg_box.setStyleSheet("""
-                QMessageBox {
-                    background-color: #23272E;
-                    color: #E0E0E0;
-                }
-                QMessageBox QPushButton {
-                    background-color: #40E0D0;
-                    color: #23272E;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    min-width: 70px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #5DADE2;
-                }
-            """)
+            msg_box.setStyleSheet(_MESSAGE_BOX_QSS)
             msg_box.exec_()
 
     def closeEvent(self, event):
         """Enhanced cleanup on window close with fade animation"""
+        self._restart_pending = False # Never start a new session while closing
         if self.worker and self.worker.isRunning():
             # Show confirmation dialog with custom styling
             msg_box = QtWidgets.QMessageBox(self)
@@ -2640,24 +2840,7 @@ class MainWindow(QtWidgets.QMainWindow):
             msg_box.setText("Downloads are still in progress. Are you sure you want to exit?")
             msg_box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
             msg_box.setDefaultButton(QtWidgets.QMessageBox.No)
-            msg_box.setStyleSheet("""
-                QMessageBox {
-                    background-color: #23272E;
-                    color: #E0E0E0;
-                }
-                QMessageBox QPushButton {
-                    background-color: #40E0D0;
-                    color: #23272E;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    min-width: 70px;
-                }
-                QMessageBox QPushButton:hover {
-                    background-color: #5DADE2;
-                }
-            """)
+            msg_box.setStyleSheet(_MESSAGE_BOX_QSS)
             
             if msg_box.exec_() == QtWidgets.QMessageBox.No:
                 event.ignore()
@@ -2667,7 +2850,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self.worker.stop()
             self.worker.wait(5000)
             
+        self._flush_input_file() # Don't lose a pending queue rewrite
+        self._io_executor.shutdown()
         self.save_settings()
+        if self._tray_icon is not None:
+            self._tray_icon.hide()
         event.accept()
 
 
@@ -2687,19 +2874,11 @@ def main():
     app.setStyle('Fusion')
     
     # Enhanced font setup with fallbacks
-    font_family = "Segoe UI"
-    available_fonts = QFontDatabase().families()
-    
     # Preferred fonts in order of preference
-    preferred_fonts = [
-        "Inter", "SF Pro Display", "SF Pro Text", 
+    font_family = preferred_font_family((
+        "Inter", "SF Pro Display", "SF Pro Text",
         "Roboto", "Ubuntu", "Segoe UI", "Helvetica Neue"
-    ]
-    
-    for font in preferred_fonts:
-        if font in available_fonts:
-            font_family = font
-            break
+    ))
     
     # Set up application font with better metrics for different screen sizes
     screen = app.primaryScreen()
@@ -2728,19 +2907,10 @@ def main():
                 window.theme_combo.setCurrentText(name)
                 break
         
-        # Center window on screen with responsive positioning
-        screen_geometry = app.primaryScreen().geometry()
-        window_geometry = window.geometry()
-        
-        # Calculate center position
-        x = (screen_geometry.width() - window_geometry.width()) // 2
-        y = (screen_geometry.height() - window_geometry.height()) // 2
-        
-        # Ensure window is not positioned off-screen
-        x = max(0, min(x, screen_geometry.width() - window_geometry.width()))
-        y = max(0, min(y, screen_geometry.height() - window_geometry.height()))
-        
-        window.move(x, y)
+        # Center on the usable screen area (taskbars/docks excluded), moved before show() so it doesn't jump
+        frame = window.frameGeometry()
+        frame.moveCenter(screen.availableGeometry().center())
+        window.move(frame.topLeft())
         window.show()
         
         # Show welcome message
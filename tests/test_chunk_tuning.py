@@ -0,0 +1,144 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+pytest.importorskip("qt_material")
+
+import main
+
+MB = 1024 * 1024
+
+
+class Tuner:
+    """Drives DownloaderWorker's hill-climb with a fake clock and synthetic byte counts."""
+
+    def __init__(self, monkeypatch, limit):
+        self.now = 100.0
+        self.downloaded = 0
+        monkeypatch.setattr(main.time, "monotonic", lambda: self.now)
+        self.worker = SimpleNamespace(
+            _chunk_limiter=main.AdaptiveLimiter(limit),
+            _log=lambda msg: None,
+            _format_speed=lambda rate: f"{rate:.0f} B/s",
+        )
+        main.DownloaderWorker._reset_tuning(self.worker)
+
+    @property
+    def limit(self):
+        return self.worker._chunk_limiter.limit
+
+    def window(self, rate, seconds=main.TUNE_WINDOW):
+        """Advance the clock by one window at the given throughput, then tune."""
+        self.now += seconds
+        self.downloaded += int(rate * seconds)
+        main.DownloaderWorker._tune_chunk_workers(self.worker, self.downloaded)
+        return self.limit
+
+
+def test_warm_up_window_only_sets_the_baseline(monkeypatch):
+    tuner = Tuner(monkeypatch, 6)
+    assert tuner.window(10 * MB, seconds=main.TUNE_WINDOW / 2) == 6 # Warm-up not over yet
+    assert tuner.window(10 * MB) == 6 # Warm-up over: baseline taken, no step
+    assert tuner.window(10 * MB, seconds=main.TUNE_WINDOW / 2) == 6 # Mid-window: nothing to measure
+
+
+def test_first_measured_window_probes_upwards(monkeypatch):
+    tuner = Tuner(monkeypatch, 6)
+    tuner.window(10 * MB)
+    assert tuner.window(10 * MB) == 8
+
+
+def test_keeps_climbing_while_throughput_improves(monkeypatch):
+    tuner = Tuner(monkeypatch, 6)
+    tuner.window(10 * MB)
+    tuner.window(10 * MB)
+    assert tuner.window(12 * MB) == 10
+    assert tuner.window(14 * MB) == 12
+
+
+def test_drop_undoes_the_last_step_and_settles(monkeypatch):
+    tuner = Tuner(monkeypatch, 6)
+    tuner.window(10 * MB)
+    tuner.window(10 * MB) # 6 -> 8
+    assert tuner.window(8 * MB) == 6 # Worse: step back
+    assert tuner.window(20 * MB) == 6 # Settled: no more exploring
+    assert tuner.window(5 * MB) == 6
+
+
+def test_flat_throughput_gives_workers_back(monkeypatch):
+    tuner = Tuner(monkeypatch, 10)
+    tuner.window(10 * MB)
+    tuner.window(10 * MB) # 10 -> 12
+    assert tuner.window(10 * MB) == 10 # Flat after a raise: undo it
+    assert tuner.window(10 * MB) == 8 # Flat after a cut: keep trimming
+
+
+def test_limit_is_clamped_to_the_bounds(monkeypatch):
+    tuner = Tuner(monkeypatch, main.MAX_CHUNK_WORKERS - 1)
+    tuner.window(10 * MB)
+    assert tuner.window(10 * MB) == main.MAX_CHUNK_WORKERS
+    assert tuner.window(20 * MB) == main.MAX_CHUNK_WORKERS
+
+    tuner = Tuner(monkeypatch, main.MIN_CHUNK_WORKERS + 2)
+    tuner.window(10 * MB)
+    tuner.window(10 * MB) # +2
+    tuner.window(10 * MB) # Flat: -2
+    assert tuner.window(10 * MB) == main.MIN_CHUNK_WORKERS
+    assert tuner.window(10 * MB) == main.MIN_CHUNK_WORKERS
+
+
+def _enter_in_thread(limiter):
+    """Start a thread that takes a limiter slot; returns (entered event, outcome dict, thread)."""
+    entered = threading.Event()
+    outcome = {}
+
+    def run():
+        try:
+            with limiter:
+                entered.set()
+                outcome["release"].wait(2)
+        except main.DownloadStopped as e:
+            outcome["error"] = e
+            entered.set()
+
+    outcome["release"] = threading.Event()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return entered, outcome, thread
+
+
+def test_limiter_blocks_at_limit_until_a_slot_frees():
+    limiter = main.AdaptiveLimiter(1)
+    with limiter:
+        entered, outcome, thread = _enter_in_thread(limiter)
+        assert not entered.wait(0.1)
+    assert entered.wait(1)
+    outcome["release"].set()
+    thread.join(1)
+    assert "error" not in outcome
+
+
+def test_raising_the_limit_wakes_waiters():
+    limiter = main.AdaptiveLimiter(1)
+    with limiter:
+        entered, outcome, thread = _enter_in_thread(limiter)
+        assert not entered.wait(0.1)
+        limiter.set_limit(2)
+        assert entered.wait(1)
+        outcome["release"].set()
+    thread.join(1)
+
+
+def test_abort_releases_waiters_with_download_stopped():
+    limiter = main.AdaptiveLimiter(1)
+    with limiter:
+        entered, outcome, thread = _enter_in_thread(limiter)
+        assert not entered.wait(0.1)
+        limiter.abort()
+        assert entered.wait(1)
+    thread.join(1)
+    assert isinstance(outcome.get("error"), main.DownloadStopped)
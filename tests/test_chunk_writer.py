@@ -0,0 +1,33 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+pytest.importorskip("qt_material")
+
+import main
+
+
+def _write_chunks(path, blocks, total_size):
+    path.write_bytes(bytes(total_size)) # Full-size file, as the download leaves it before chunks start
+    worker = SimpleNamespace(_log=print)
+    with main.DownloaderWorker._open_chunk_writer(worker, str(path), total_size) as write_at:
+        for offset, data in blocks:
+            write_at(offset, data)
+
+
+@pytest.mark.parametrize("use_pwrite", [True, False], ids=["pwrite", "mmap"])
+def test_chunk_writer_places_blocks_at_offsets(tmp_path, monkeypatch, use_pwrite):
+    if not use_pwrite:
+        monkeypatch.delattr(os, "pwrite", raising=False) # Take the Windows mmap fallback
+    elif not hasattr(os, "pwrite"):
+        pytest.skip("os.pwrite not available on this platform")
+
+    path = tmp_path / "out.bin"
+    # Out of order, as parallel chunks finish
+    _write_chunks(path, [(6, b"world"), (0, b"hello "), (11, memoryview(b"!"))], 12)
+
+    assert path.read_bytes() == b"hello world!"
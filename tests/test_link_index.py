@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5")
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+pytest.importorskip("qt_material")
+
+from PyQt5 import QtWidgets
+
+import main
+
+
+@pytest.fixture
+def link_list():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    widget = main.QListWidgetLinks(None)
+    yield widget
+    widget.deleteLater()
+    app.processEvents()
+
+
+def test_duplicate_url_stays_indexed_after_one_copy_is_taken(link_list):
+    url = "https://example.com/file.zip"
+    first = link_list.add_link(url)
+    second = link_list.add_link(url)
+
+    assert link_list.takeItem(link_list.row(first)) is first
+
+    assert link_list.has_link(url)
+    assert link_list.item_for(url) is second
+
+
+def test_url_leaves_index_with_its_last_copy(link_list):
+    url = "https://example.com/file.zip"
+    link_list.add_link(url)
+    link_list.add_link(url)
+
+    link_list.takeItem(0)
+    link_list.takeItem(0)
+
+    assert not link_list.has_link(url)
+    assert link_list.item_for(url) is None
+
+
+def test_clear_empties_index(link_list):
+    link_list.add_link("https://example.com/a.zip")
+    link_list.clear()
+
+    assert not link_list.has_link("https://example.com/a.zip")